@@ -0,0 +1,115 @@
+"""Thin client for the BizAutoGen daemon (``python main.py --daemon``).
+
+Only the standard library is imported so each call costs a socket round trip
+rather than an interpreter full of Selenium.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+from typing import List
+
+
+def default_socket_path() -> str:
+    """Return the per-user socket path shared by the daemon and the client.
+
+    The socket lives in a directory only its owner can enter; see
+    :func:`check_socket_dir`.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "bizautogen.sock")
+    return os.path.join(tempfile.gettempdir(), f"bizautogen-{os.getuid()}", "daemon.sock")
+
+
+def check_socket_dir(socket_path: str, create: bool = False) -> None:
+    """Make sure the directory holding ``socket_path`` is private to this user.
+
+    With ``create`` the directory is made with mode 0700 when missing. Raises
+    ``PermissionError`` if it belongs to someone else or others can enter it,
+    since another local user could then stand in for the daemon.
+    """
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    if create:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{directory} must be a directory owned by you with mode 0700")
+
+
+def request(payload: dict, socket_path: str | None = None) -> dict:
+    """Send one request to the daemon and return its decoded reply.
+
+    Without ``socket_path`` the default socket is used, after checking that
+    its directory is private to this user.
+    """
+    if socket_path is None:
+        socket_path = default_socket_path()
+        check_socket_dir(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(socket_path)
+        conn.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        conn.shutdown(socket.SHUT_WR)
+        chunks: List[bytes] = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks))
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Submit a module request to a running BizAutoGen daemon",
+    )
+    parser.add_argument(
+        "module",
+        help="Module name (idea_validator, content_generator, pricing_advisor, business_plan, task_automator) or 'stats'",
+    )
+    parser.add_argument(
+        "args",
+        nargs="?",
+        default="{}",
+        help="Module keyword arguments as a JSON object, or '-' to read them from stdin",
+    )
+    parser.add_argument(
+        "--socket",
+        help="Path of the daemon's Unix socket (defaults to a per-user runtime directory)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv or sys.argv[1:])
+    if args.module == "stats":
+        payload: dict = {"command": "stats"}
+    else:
+        raw_args = sys.stdin.read() if args.args == "-" else args.args
+        try:
+            payload = {"module": args.module, "args": json.loads(raw_args)}
+        except ValueError as exc:
+            print(f"Invalid JSON arguments: {exc}", file=sys.stderr)
+            return 2
+
+    try:
+        reply = request(payload, args.socket)
+    except OSError as exc:
+        print(f"Could not reach BizAutoGen daemon at {args.socket or default_socket_path()}: {exc}", file=sys.stderr)
+        return 1
+
+    if not reply.get("ok"):
+        print(f"Error: {reply.get('error')}", file=sys.stderr)
+        return 1
+    print(json.dumps(reply.get("result"), indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,15 +5,19 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
-from typing import List
+from typing import Dict, List
 
 from modules import (
+    MODULES,
     create_automation_plan,
     generate_business_plan,
     generate_marketing_content,
     get_pricing_strategy,
     run_idea_validator,
 )
+from utils.cassette import RecordingPool, ReplayPool
+from utils.pool import BrowserPool
+from utils.profiles import ProfilePool, default_profile_root
 
 LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +41,73 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         action="store_true",
         help="Display the browser window instead of running headless",
     )
+    parser.add_argument(
+        "--structured",
+        action="store_true",
+        help="Ask cto.new for strict JSON responses instead of free-form headings",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="Overall time budget in seconds for each request, retries included",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep warm browser sessions and serve requests from client.py over a Unix socket",
+    )
+    parser.add_argument(
+        "--socket",
+        help="Unix socket path used in daemon mode (defaults to a per-user runtime directory)",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=2,
+        help="Number of warm browser sessions kept by the daemon, which also caps concurrent requests",
+    )
+    parser.add_argument(
+        "--persistent-profiles",
+        action="store_true",
+        help="Run browsers on pooled persistent profiles so caches and cookies survive between launches",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=default_profile_root(),
+        help="Directory holding the pooled browser profiles",
+    )
+    parser.add_argument(
+        "--profile-count",
+        type=int,
+        default=4,
+        help="Number of persistent profiles in the pool",
+    )
+    parser.add_argument(
+        "--reset-profiles",
+        action="store_true",
+        help="Delete all idle pooled profiles and exit",
+    )
+    parser.add_argument(
+        "--clean-profile-locks",
+        action="store_true",
+        help="Remove browser lock files left in idle profiles by crashed processes and exit",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record every prompt, response and phase timing to a cassette file (.jsonl or .jsonl.gz)",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Serve responses from a recorded cassette instead of launching a browser",
+    )
+    parser.add_argument(
+        "--replay-realtime",
+        action="store_true",
+        help="Reproduce the recorded latency of each phase when replaying",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -55,8 +126,41 @@ def configure_logging(level: str) -> None:
 def main(argv: List[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
     configure_logging(args.log_level)
-    headless = not args.visible
+    if args.reset_profiles or args.clean_profile_locks:
+        return _maintain_profiles(args)
+    profiles = ProfilePool(args.profile_dir, args.profile_count) if args.persistent_profiles else None
+    if args.daemon:
+        # Unix sockets only; imported here so the menu still runs on Windows.
+        from client import check_socket_dir, default_socket_path
+        from utils.daemon import serve
+
+        socket_path = args.socket or default_socket_path()
+        if args.socket is None:
+            check_socket_dir(socket_path, create=True)
+
+        pool = _build_pool(args, profiles, args.pool_size) or BrowserPool(
+            args.pool_size,
+            headless=not args.visible,
+            profiles=profiles,
+        )
+        return serve(socket_path, MODULES, pool, structured=args.structured, deadline=args.deadline)
+
+    pool = _build_pool(args, profiles, 1)
+    options: Dict[str, object] = {
+        "headless": not args.visible,
+        "structured": args.structured,
+        "deadline": args.deadline,
+        "profiles": profiles,
+        "pool": pool,
+    }
+    try:
+        return _run_menu(options)
+    finally:
+        if pool is not None:
+            pool.close()
+
 
+def _run_menu(options: Dict[str, object]) -> int:
     print("\nWelcome to BizAutoGen! Automate your business workflows using cto.new.\n")
 
     while True:
@@ -71,30 +175,51 @@ def main(argv: List[str] | None = None) -> int:
             print("Thanks for using BizAutoGen. Goodbye!")
             return 0
         elif choice == "1":
-            _handle_idea_validator(headless)
+            _handle_idea_validator(options)
         elif choice == "2":
-            _handle_marketing_content(headless)
+            _handle_marketing_content(options)
         elif choice == "3":
-            _handle_pricing_advice(headless)
+            _handle_pricing_advice(options)
         elif choice == "4":
-            _handle_business_plan(headless)
+            _handle_business_plan(options)
         elif choice == "5":
-            _handle_automation_plan(headless)
+            _handle_automation_plan(options)
         else:
             print("Invalid choice. Please try again.\n")
 
 
+def _build_pool(args: argparse.Namespace, profiles: ProfilePool | None, size: int) -> BrowserPool | None:
+    if args.replay:
+        return ReplayPool(args.replay, size, realtime=args.replay_realtime)
+    if args.record:
+        return RecordingPool(args.record, size, headless=not args.visible, profiles=profiles)
+    return None
+
+
+def _maintain_profiles(args: argparse.Namespace) -> int:
+    profiles = ProfilePool(args.profile_dir, args.profile_count)
+    if args.clean_profile_locks:
+        freed = profiles.clean_stale_locks()
+        print(f"Cleared stale browser locks in {len(freed)} profile(s) under {profiles.root}")
+    if args.reset_profiles:
+        busy = profiles.reset()
+        for path in busy:
+            print(f"Skipped {path}: in use")
+        print(f"Reset browser profiles under {profiles.root}")
+    return 0
+
+
 def _print_menu() -> None:
     print("Please choose an option:")
     for key in ("1", "2", "3", "4", "5", "q"):
         print(f"  {key}. {MENU_OPTIONS[key]}")
 
 
-def _handle_idea_validator(headless: bool) -> None:
+def _handle_idea_validator(options: Dict[str, object]) -> None:
     try:
         idea = input("Describe your business idea: ").strip()
         print("\nValidating idea. Please wait...\n")
-        result = run_idea_validator(idea, headless=headless)
+        result = run_idea_validator(idea, **options)
         _display_swot_result(result)
     except Exception as exc:
         LOGGER.error("Idea validation failed: %s", exc)
@@ -116,12 +241,12 @@ def _display_swot_result(result: dict) -> None:
     print()
 
 
-def _handle_marketing_content(headless: bool) -> None:
+def _handle_marketing_content(options: Dict[str, object]) -> None:
     try:
         product = input("Product or service name: ").strip()
         tone = input("Desired tone (e.g., professional, casual, funny): ").strip()
         print("\nGenerating marketing content. Please wait...\n")
-        result = generate_marketing_content(product, tone, headless=headless)
+        result = generate_marketing_content(product, tone, **options)
         print("Ad Copy:\n" + result.get("ad_copy", ""))
         print("\nSocial Caption:\n" + result.get("social_caption", ""))
         print("\nBlog Intro:\n" + result.get("blog_intro", "") + "\n")
@@ -130,13 +255,13 @@ def _handle_marketing_content(headless: bool) -> None:
         print(f"Error: {exc}\n")
 
 
-def _handle_pricing_advice(headless: bool) -> None:
+def _handle_pricing_advice(options: Dict[str, object]) -> None:
     try:
         cost = float(input("Production cost per unit: $"))
         profit_pct = int(input("Target profit percentage: "))
         competitors = _collect_list("Enter a competitor (leave blank to finish)")
         print("\nGenerating pricing strategy. Please wait...\n")
-        result = get_pricing_strategy(cost, profit_pct, competitors, headless=headless)
+        result = get_pricing_strategy(cost, profit_pct, competitors, **options)
         print(f"Recommended Price: {result.get('recommended_price')}")
         print("\nPricing Strategy:\n" + result.get("strategy", ""))
         print("\nRationale:\n" + result.get("rationale", "") + "\n")
@@ -147,24 +272,24 @@ def _handle_pricing_advice(headless: bool) -> None:
         print(f"Error: {exc}\n")
 
 
-def _handle_business_plan(headless: bool) -> None:
+def _handle_business_plan(options: Dict[str, object]) -> None:
     try:
         name = input("Business name: ").strip()
         print("Enter business goals (leave blank when finished):")
         goals = _collect_list("Goal")
         print("\nGenerating business plan. Please wait...\n")
-        plan = generate_business_plan(name, goals, headless=headless)
+        plan = generate_business_plan(name, goals, **options)
         print("Business Plan:\n" + plan + "\n")
     except Exception as exc:
         LOGGER.error("Business plan generation failed: %s", exc)
         print(f"Error: {exc}\n")
 
 
-def _handle_automation_plan(headless: bool) -> None:
+def _handle_automation_plan(options: Dict[str, object]) -> None:
     try:
         description = input("Describe the business tasks to automate: ").strip()
         print("\nBuilding automation plan. Please wait...\n")
-        result = create_automation_plan(description, headless=headless)
+        result = create_automation_plan(description, **options)
         print("Automation Plan:\n" + result.get("automation_plan", ""))
         print("\nExecution Steps:")
         for idx, step in enumerate(result.get("execution_steps", []), start=1):
@@ -1,14 +1,26 @@
 """Business automation modules for BizAutoGen."""
 
-from .idea_validator import run_idea_validator
-from .content_generator import generate_marketing_content
+from .idea_validator import run_idea_validator, run_idea_validator_batch
+from .content_generator import generate_marketing_content, generate_marketing_content_batch
 from .pricing_advisor import get_pricing_strategy
 from .business_plan import generate_business_plan
 from .task_automator import create_automation_plan
 
+# Module functions by the name used on the command line and over the daemon socket.
+MODULES = {
+    "idea_validator": run_idea_validator,
+    "content_generator": generate_marketing_content,
+    "pricing_advisor": get_pricing_strategy,
+    "business_plan": generate_business_plan,
+    "task_automator": create_automation_plan,
+}
+
 __all__ = [
+    "MODULES",
     "run_idea_validator",
+    "run_idea_validator_batch",
     "generate_marketing_content",
+    "generate_marketing_content_batch",
     "get_pricing_strategy",
     "generate_business_plan",
     "create_automation_plan",
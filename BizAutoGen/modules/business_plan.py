@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import logging
 from typing import Sequence
 
-from ..utils.browser import SeleniumBrowser
-from ..utils.parser import parse_plan
-
-LOGGER = logging.getLogger(__name__)
+from utils.concurrency import AdaptiveLimiter
+from utils.parser import JSON_ONLY_INSTRUCTION, parse_plan
+from utils.pool import BrowserPool
+from utils.profiles import ProfilePool
+from utils.session import run_prompt
 
 
 def generate_business_plan(
@@ -17,6 +17,12 @@ def generate_business_plan(
     *,
     headless: bool = True,
     retries: int = 2,
+    structured: bool = False,
+    limiter: AdaptiveLimiter | None = None,
+    pool: BrowserPool | None = None,
+    deadline: float | None = None,
+    complete: bool = True,
+    profiles: ProfilePool | None = None,
 ) -> str:
     """Generate a comprehensive business plan document."""
     if not business_name or not business_name.strip():
@@ -25,22 +31,39 @@ def generate_business_plan(
     if not goal_items:
         raise ValueError("At least one business goal must be supplied")
 
-    last_error: Exception | None = None
-    for attempt in range(1, retries + 2):
-        try:
-            with SeleniumBrowser(headless=headless) as browser:
-                browser.open_cto_new()
-                browser.send_prompt(_build_prompt(business_name, goal_items))
-                response = browser.extract_response()
-            return parse_plan(response)
-        except Exception as exc:  # pragma: no cover - relies on live interaction
-            last_error = exc
-            LOGGER.exception("Business plan attempt %s failed", attempt)
-    raise RuntimeError("Unable to build business plan via cto.new") from last_error
-
-
-def _build_prompt(business_name: str, goals: Sequence[str]) -> str:
+    return run_prompt(
+        _build_prompt(business_name, goal_items, structured),
+        lambda response: parse_plan(response, structured=structured),
+        label="Business plan",
+        error_message="Unable to build business plan via cto.new",
+        headless=headless,
+        retries=retries,
+        limiter=limiter,
+        pool=pool,
+        deadline=deadline,
+        kind="plan" if complete else None,
+        structured=structured,
+        profiles=profiles,
+    )
+
+
+_JSON_SCHEMA = '{"sections": [{"heading": "<section name>", "content": "<2-4 sentences or bullet points>"}, "..."]}'
+
+
+def _build_prompt(business_name: str, goals: Sequence[str], structured: bool = False) -> str:
     goal_section = "\n".join(f"- {goal}" for goal in goals)
+    if structured:
+        return (
+            "You are BizAutoGen, a world-class business consultant.\n"
+            "Create a concise but comprehensive business plan using the structure below.\n\n"
+            f"Business Name: {business_name.strip()}\n"
+            "Primary Goals:\n"
+            f"{goal_section}\n\n"
+            f"{JSON_ONLY_INSTRUCTION} matching this schema."
+            " Include one section each for Executive Summary, Market Analysis, Product/Service Offering, Marketing Strategy,"
+            " Operations Plan, Financial Projections, and Key Milestones, in that order:\n"
+            f"{_JSON_SCHEMA}\n"
+        )
     return (
         "You are BizAutoGen, a world-class business consultant.\n"
         "Create a concise but comprehensive business plan using the structure below.\n\n"
@@ -48,5 +71,6 @@ def _build_prompt(business_name: str, goals: Sequence[str]) -> str:
         "Primary Goals:\n"
         f"{goal_section}\n\n"
         "Respond with clearly labelled sections including Executive Summary, Market Analysis, Product/Service Offering, Marketing Strategy, Operations Plan, Financial Projections, and Key Milestones.\n"
+        "Start each section with its heading on a line of its own followed by a colon, for example \"Executive Summary:\".\n"
         "Each section should contain 2-4 sentences or bullet points with actionable detail.\n"
     )
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import logging
-from typing import Dict
+from typing import Dict, List, Sequence
 
-from ..utils.browser import SeleniumBrowser
-from ..utils.parser import parse_marketing
-
-LOGGER = logging.getLogger(__name__)
+from utils.concurrency import AdaptiveLimiter
+from utils.packing import run_packed
+from utils.parser import JSON_ONLY_INSTRUCTION, parse_marketing
+from utils.pool import BrowserPool
+from utils.profiles import ProfilePool
+from utils.session import run_prompt
 
 
 def generate_marketing_content(
@@ -17,6 +18,12 @@ def generate_marketing_content(
     *,
     headless: bool = True,
     retries: int = 2,
+    structured: bool = False,
+    limiter: AdaptiveLimiter | None = None,
+    pool: BrowserPool | None = None,
+    deadline: float | None = None,
+    complete: bool = True,
+    profiles: ProfilePool | None = None,
 ) -> Dict[str, str]:
     """Generate marketing collateral for a product in a requested tone."""
     if not product or not product.strip():
@@ -24,23 +31,94 @@ def generate_marketing_content(
     if not tone or not tone.strip():
         raise ValueError("Tone must be provided")
 
-    last_error: Exception | None = None
-    for attempt in range(1, retries + 2):
-        try:
-            with SeleniumBrowser(headless=headless) as browser:
-                browser.open_cto_new()
-                browser.send_prompt(_build_prompt(product, tone))
-                response = browser.extract_response()
-            return parse_marketing(response)
-        except Exception as exc:  # pragma: no cover - interactions are live
-            last_error = exc
-            LOGGER.exception("Content generator attempt %s failed", attempt)
-    raise RuntimeError("Unable to generate marketing content via cto.new") from last_error
-
-
-def _build_prompt(product: str, tone: str) -> str:
+    return run_prompt(
+        _build_prompt(product, tone, structured),
+        lambda response: parse_marketing(response, structured=structured),
+        label="Content generator",
+        error_message="Unable to generate marketing content via cto.new",
+        headless=headless,
+        retries=retries,
+        limiter=limiter,
+        pool=pool,
+        deadline=deadline,
+        kind="marketing" if complete else None,
+        structured=structured,
+        profiles=profiles,
+    )
+
+
+def generate_marketing_content_batch(
+    products: Sequence[str],
+    tone: str,
+    *,
+    pack_size: int = 5,
+    headless: bool = True,
+    retries: int = 2,
+    structured: bool = False,
+    limiter: AdaptiveLimiter | None = None,
+    pool: BrowserPool | None = None,
+    deadline: float | None = None,
+    profiles: ProfilePool | None = None,
+) -> List[Dict[str, str] | Exception]:
+    """Generate marketing collateral for several products in one tone, packing up to ``pack_size`` per prompt.
+
+    Results come back in input order. A product whose copy cannot be split
+    out of a packed response is generated on its own; if that fails too its
+    slot holds the exception. ``deadline`` is one budget for the whole batch.
+    """
+    if any(not product or not product.strip() for product in products):
+        raise ValueError("Every product or service name must be provided")
+    if not tone or not tone.strip():
+        raise ValueError("Tone must be provided")
+
+    return run_packed(
+        [_build_prompt(product, tone, structured) for product in products],
+        lambda response: parse_marketing(response, structured=structured),
+        lambda index, remaining: generate_marketing_content(
+            products[index],
+            tone,
+            headless=headless,
+            retries=retries,
+            structured=structured,
+            limiter=limiter,
+            pool=pool,
+            deadline=remaining,
+            profiles=profiles,
+        ),
+        kind="marketing",
+        label="Content generator",
+        error_message="Unable to generate packed marketing content via cto.new",
+        structured=structured,
+        pack_size=pack_size,
+        limiter=limiter,
+        headless=headless,
+        retries=retries,
+        pool=pool,
+        deadline=deadline,
+        profiles=profiles,
+    )
+
+
+_JSON_SCHEMA = (
+    '{"ad_copy": "<short persuasive paragraph for a paid advertisement>", '
+    '"social_caption": "<1-2 sentence caption with a call-to-action>", '
+    '"blog_intro": "<engaging introductory paragraph for a blog article>"}'
+)
+
+
+def _build_prompt(product: str, tone: str, structured: bool = False) -> str:
     clean_product = product.strip()
     clean_tone = tone.strip()
+    if structured:
+        return (
+            "You are BizAutoGen's marketing specialist.\n"
+            "Create compelling marketing content for the product described below.\n\n"
+            f"Product or Service: {clean_product}\n"
+            f"Desired Tone: {clean_tone}\n\n"
+            f"{JSON_ONLY_INSTRUCTION} matching this schema,"
+            " replacing all placeholders with original copy and using emoji only if it fits the tone:\n"
+            f"{_JSON_SCHEMA}\n"
+        )
     return (
         "You are BizAutoGen's marketing specialist.\n"
         "Create compelling marketing content for the product described below.\n\n"
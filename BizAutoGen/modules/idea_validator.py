@@ -2,36 +2,116 @@
 
 from __future__ import annotations
 
-import logging
-from typing import Dict
+from typing import Dict, List, Sequence
 
-from ..utils.browser import SeleniumBrowser
-from ..utils.parser import parse_swot
+from utils.concurrency import AdaptiveLimiter
+from utils.packing import run_packed
+from utils.parser import JSON_ONLY_INSTRUCTION, parse_swot
+from utils.pool import BrowserPool
+from utils.profiles import ProfilePool
+from utils.session import run_prompt
 
-LOGGER = logging.getLogger(__name__)
 
-
-def run_idea_validator(idea: str, *, headless: bool = True, retries: int = 2) -> Dict[str, object]:
+def run_idea_validator(
+    idea: str,
+    *,
+    headless: bool = True,
+    retries: int = 2,
+    structured: bool = False,
+    limiter: AdaptiveLimiter | None = None,
+    pool: BrowserPool | None = None,
+    deadline: float | None = None,
+    complete: bool = True,
+    profiles: ProfilePool | None = None,
+) -> Dict[str, object]:
     """Validate a business idea using cto.new and return structured insights."""
     if not idea or not idea.strip():
         raise ValueError("Business idea must be provided")
 
-    last_error: Exception | None = None
-    for attempt in range(1, retries + 2):
-        try:
-            with SeleniumBrowser(headless=headless) as browser:
-                browser.open_cto_new()
-                browser.send_prompt(_build_prompt(idea))
-                response = browser.extract_response()
-            return parse_swot(response)
-        except Exception as exc:  # pragma: no cover - defensive logging for live interactions
-            last_error = exc
-            LOGGER.exception("Idea validator attempt %s failed", attempt)
-    raise RuntimeError("Unable to complete idea validation via cto.new") from last_error
-
-
-def _build_prompt(idea: str) -> str:
+    return run_prompt(
+        _build_prompt(idea, structured),
+        lambda response: parse_swot(response, structured=structured),
+        label="Idea validator",
+        error_message="Unable to complete idea validation via cto.new",
+        headless=headless,
+        retries=retries,
+        limiter=limiter,
+        pool=pool,
+        deadline=deadline,
+        kind="swot" if complete else None,
+        structured=structured,
+        profiles=profiles,
+    )
+
+
+def run_idea_validator_batch(
+    ideas: Sequence[str],
+    *,
+    pack_size: int = 5,
+    headless: bool = True,
+    retries: int = 2,
+    structured: bool = False,
+    limiter: AdaptiveLimiter | None = None,
+    pool: BrowserPool | None = None,
+    deadline: float | None = None,
+    profiles: ProfilePool | None = None,
+) -> List[Dict[str, object] | Exception]:
+    """Validate several ideas, packing up to ``pack_size`` of them into each cto.new prompt.
+
+    Results come back in input order. An idea whose analysis cannot be split
+    out of a packed response is validated on its own; if that fails too its
+    slot holds the exception. ``deadline`` is one budget for the whole batch.
+    """
+    if any(not idea or not idea.strip() for idea in ideas):
+        raise ValueError("Every business idea must be provided")
+
+    return run_packed(
+        [_build_prompt(idea, structured) for idea in ideas],
+        lambda response: parse_swot(response, structured=structured),
+        lambda index, remaining: run_idea_validator(
+            ideas[index],
+            headless=headless,
+            retries=retries,
+            structured=structured,
+            limiter=limiter,
+            pool=pool,
+            deadline=remaining,
+            profiles=profiles,
+        ),
+        kind="swot",
+        label="Idea validator",
+        error_message="Unable to complete packed idea validation via cto.new",
+        structured=structured,
+        pack_size=pack_size,
+        limiter=limiter,
+        headless=headless,
+        retries=retries,
+        pool=pool,
+        deadline=deadline,
+        profiles=profiles,
+    )
+
+
+_JSON_SCHEMA = (
+    '{"swot": {"strengths": ["<strength insight>", "..."], "weaknesses": ["<weakness insight>", "..."], '
+    '"opportunities": ["<opportunity insight>", "..."], "threats": ["<threat insight>", "..."]}, '
+    '"market_potential": "<one paragraph on demand, market size, and growth outlook>", '
+    '"recommendations": ["<actionable recommendation>", "<actionable recommendation>", "<actionable recommendation>"]}'
+)
+
+
+def _build_prompt(idea: str, structured: bool = False) -> str:
     clean_idea = idea.strip()
+    if structured:
+        return (
+            "You are BizAutoGen, an expert business strategist.\n"
+            "Analyze the business concept below and produce a concise, structured response.\n\n"
+            "Business Idea:\n"
+            f"{clean_idea}\n\n"
+            f"{JSON_ONLY_INSTRUCTION} matching this schema,"
+            " with at least two entries per SWOT list and every placeholder replaced:\n"
+            f"{_JSON_SCHEMA}\n"
+        )
     return (
         "You are BizAutoGen, an expert business strategist.\n"
         "Analyze the business concept below and produce a concise, structured response.\n\n"
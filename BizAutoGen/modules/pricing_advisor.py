@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import logging
 from typing import Dict, Sequence
 
-from ..utils.browser import SeleniumBrowser
-from ..utils.parser import parse_pricing
-
-LOGGER = logging.getLogger(__name__)
+from utils.concurrency import AdaptiveLimiter
+from utils.parser import JSON_ONLY_INSTRUCTION, parse_pricing
+from utils.pool import BrowserPool
+from utils.profiles import ProfilePool
+from utils.session import run_prompt
 
 
 def get_pricing_strategy(
@@ -18,6 +18,12 @@ def get_pricing_strategy(
     *,
     headless: bool = True,
     retries: int = 2,
+    structured: bool = False,
+    limiter: AdaptiveLimiter | None = None,
+    pool: BrowserPool | None = None,
+    deadline: float | None = None,
+    complete: bool = True,
+    profiles: ProfilePool | None = None,
 ) -> Dict[str, str]:
     """Generate a pricing strategy recommendation based on inputs."""
     if cost <= 0:
@@ -27,22 +33,47 @@ def get_pricing_strategy(
 
     competitor_list = [comp.strip() for comp in (competitors or []) if comp and comp.strip()]
 
-    last_error: Exception | None = None
-    for attempt in range(1, retries + 2):
-        try:
-            with SeleniumBrowser(headless=headless) as browser:
-                browser.open_cto_new()
-                browser.send_prompt(_build_prompt(cost, target_profit_pct, competitor_list))
-                response = browser.extract_response()
-            return parse_pricing(response)
-        except Exception as exc:  # pragma: no cover - dependent on live service
-            last_error = exc
-            LOGGER.exception("Pricing advisor attempt %s failed", attempt)
-    raise RuntimeError("Unable to obtain pricing strategy via cto.new") from last_error
-
-
-def _build_prompt(cost: float, target_profit_pct: int, competitors: Sequence[str]) -> str:
+    return run_prompt(
+        _build_prompt(cost, target_profit_pct, competitor_list, structured),
+        lambda response: parse_pricing(response, structured=structured),
+        label="Pricing advisor",
+        error_message="Unable to obtain pricing strategy via cto.new",
+        headless=headless,
+        retries=retries,
+        limiter=limiter,
+        pool=pool,
+        deadline=deadline,
+        kind="pricing" if complete else None,
+        structured=structured,
+        profiles=profiles,
+    )
+
+
+_JSON_SCHEMA = (
+    '{"recommended_price": "<specific price or range>", '
+    '"strategy": "<pricing strategy>", '
+    '"rationale": "<justification covering cost-plus and competitive positioning>"}'
+)
+
+
+def _build_prompt(
+    cost: float,
+    target_profit_pct: int,
+    competitors: Sequence[str],
+    structured: bool = False,
+) -> str:
     competitor_section = "\n".join(f"- {comp}" for comp in competitors) or "- None provided"
+    if structured:
+        return (
+            "You are BizAutoGen's pricing strategist.\n"
+            "Evaluate the product economics and craft a pricing recommendation.\n\n"
+            f"Production Cost per Unit: ${cost:.2f}\n"
+            f"Target Profit Margin: {target_profit_pct}%\n"
+            "Competitors:\n"
+            f"{competitor_section}\n\n"
+            f"{JSON_ONLY_INSTRUCTION} matching this schema:\n"
+            f"{_JSON_SCHEMA}\n"
+        )
     return (
         "You are BizAutoGen's pricing strategist.\n"
         "Evaluate the product economics and craft a pricing recommendation.\n\n"
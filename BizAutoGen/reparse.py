@@ -0,0 +1,83 @@
+"""Re-derive structured results from archived raw responses.
+
+Run this after changing the heading aliases in ``utils/parser.py``::
+
+    python reparse.py archive.jsonl -o results.jsonl
+    python reparse.py archive.db --sqlite-query "SELECT id, kind, response FROM raw" -o results.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from typing import List
+
+from utils.bulk import DEFAULT_SQLITE_QUERY, read_jsonl, read_sqlite, reparse
+from utils.parser import PARSERS
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Bulk re-parse stored cto.new responses with the current parsers",
+    )
+    parser.add_argument(
+        "source",
+        help="JSON Lines file, or a SQLite database when the name ends in .db, .sqlite or .sqlite3",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="JSON Lines file to write parsed results to",
+    )
+    parser.add_argument(
+        "--kind",
+        choices=sorted(PARSERS),
+        help="Parser to use for records that do not name one",
+    )
+    parser.add_argument(
+        "--sqlite-query",
+        default=DEFAULT_SQLITE_QUERY,
+        help="Query returning a response column (and optionally id, kind, structured)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of parser processes (defaults to the CPU count)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Records sent to a worker at a time",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        help="Logging level (DEBUG, INFO, WARNING, ERROR)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv or sys.argv[1:])
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format="%(asctime)s | %(levelname)-7s | %(name)s | %(message)s",
+    )
+    if args.source.endswith((".db", ".sqlite", ".sqlite3")):
+        records = read_sqlite(args.source, args.sqlite_query, default_kind=args.kind)
+    else:
+        records = read_jsonl(args.source, default_kind=args.kind)
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        summary = reparse(records, output, workers=args.workers, batch_size=args.batch_size)
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The scripts import ``utils`` and ``modules`` as top-level packages.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
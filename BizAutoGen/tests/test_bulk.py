@@ -0,0 +1,28 @@
+import io
+import json
+
+from utils.bulk import read_jsonl, reparse
+
+
+def test_malformed_lines_are_reported_per_record(tmp_path):
+    source = tmp_path / "archive.jsonl"
+    source.write_text(
+        json.dumps({"id": "a", "kind": "pricing", "response": "Recommended Price: $5"})
+        + "\n{bad\n\n[1]\n"
+        + json.dumps({"id": "b", "response": "Recommended Price: $9"})
+        + "\n"
+        + json.dumps({"id": "c", "kind": "pricing"})
+        + "\n"
+    )
+    output = io.StringIO()
+    summary = reparse(read_jsonl(str(source), default_kind="pricing"), output, workers=1, batch_size=2)
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line["id"] for line in lines] == ["a", 2, 4, "b", "c"]
+    assert lines[1]["error"].startswith("Invalid JSON")
+    assert lines[2]["error"] == "Record must be a JSON object"
+    assert lines[3]["result"]["recommended_price"] == "$9"
+    assert lines[4] == {"id": "c", "kind": "pricing", "error": "Record has no response"}
+    assert summary["records"] == 5
+    assert summary["parsed"] == 2
+    assert summary["errors"] == 3
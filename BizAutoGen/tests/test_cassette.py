@@ -0,0 +1,75 @@
+import json
+
+from utils.cassette import RecordingBrowser, RecordingPool, ReplayPool
+from utils.concurrency import AdaptiveLimiter
+from utils.parser import parse_pricing
+from utils.session import run_prompt
+
+PARTIAL = "Recommended Price: $20\nStrategy: Value"
+COMPLETE = PARTIAL + "\nRationale: Cheap inputs"
+
+
+class StubBrowser:
+    """Answers every prompt with a partial response that completes once it settles."""
+
+    def __init__(self):
+        self.timings = {}
+
+    def open_cto_new(self, deadline=None):
+        self.timings = {"open": 1.5}
+
+    def send_prompt(self, prompt, wait_time=None, deadline=None):
+        self.timings.update({"send": 0.25, "response_start": 2.0})
+
+    def extract_response(self, wait_time=None, deadline=None):
+        self.timings["extract"] = 3.0
+        return PARTIAL
+
+    def wait_for_stable_response(self, stable_for=2.0, wait_time=None, deadline=None):
+        self.timings["stabilise"] = 1.0
+        return COMPLETE
+
+    def close(self):
+        pass
+
+
+class StubRecordingPool(RecordingPool):
+    def _new_browser(self, user_data_dir):
+        return RecordingBrowser(StubBrowser(), self.writer)
+
+
+def _ask(pool):
+    return run_prompt(
+        "Price my bakery",
+        parse_pricing,
+        label="Pricing",
+        error_message="failed",
+        limiter=AdaptiveLimiter(),
+        pool=pool,
+        kind="pricing",
+    )
+
+
+def test_record_then_replay_round_trip(tmp_path):
+    path = str(tmp_path / "session.jsonl.gz")
+    pool = StubRecordingPool(path)
+    recorded = _ask(pool)
+    pool.close()
+    assert recorded["rationale"] == "Cheap inputs"
+
+    with ReplayPool(path) as replay:
+        assert len(replay.cassette) == 1
+        exchange = replay.cassette.next_exchange("Price my bakery")
+        assert exchange["timings"] == {"open": 1.5, "send": 0.25, "response_start": 2.0}
+        assert exchange["outputs"] == [["extract", PARTIAL, 3.0], ["stabilise", COMPLETE, 1.0]]
+        assert _ask(replay) == recorded
+
+
+def test_exchange_is_written_when_the_request_ends(tmp_path):
+    path = tmp_path / "session.jsonl"
+    pool = StubRecordingPool(str(path))
+    _ask(pool)
+    # Written before the pooled browser is reused or the pool closed.
+    assert [json.loads(line)["prompt"] for line in path.read_text().splitlines()] == ["Price my bakery"]
+    pool.close()
+    assert len(path.read_text().splitlines()) == 1
@@ -0,0 +1,88 @@
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from utils.concurrency import AdaptiveLimiter
+from utils.deadline import Deadline, DeadlineExceeded
+
+
+def _succeed(limiter, latency):
+    with limiter.slot() as slot:
+        slot.record(latency)
+
+
+def test_limit_grows_with_steady_latency():
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=4)
+    for _ in range(20):
+        _succeed(limiter, 2.0)
+    assert limiter.limit == 4
+
+
+def test_one_fast_sample_does_not_pin_the_limit():
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=8, latency_window=50)
+    _succeed(limiter, 0.5)
+    for _ in range(200):
+        _succeed(limiter, 2.0)
+    snapshot = limiter.snapshot()
+    assert snapshot["successes"] == 201
+    assert snapshot["errors"] == 0
+    assert snapshot["latency_floor"] == 2.0
+    assert limiter.limit == 8
+
+
+def test_sustained_latency_rise_lowers_the_limit():
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=4)
+    for _ in range(10):
+        _succeed(limiter, 1.0)
+    for _ in range(10):
+        _succeed(limiter, 5.0)
+    assert limiter.limit < 4
+
+
+def test_congestion_error_halves_the_limit():
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=8)
+    with pytest.raises(TimeoutException):
+        with limiter.slot():
+            raise TimeoutException("no response")
+    assert limiter.limit == 2
+    assert limiter.snapshot()["errors"] == 1
+
+
+def test_other_errors_leave_the_limit_alone():
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=8)
+    with pytest.raises(ValueError):
+        with limiter.slot():
+            raise ValueError("bad prompt")
+    assert limiter.limit == 4
+    assert limiter.snapshot()["errors"] == 0
+
+
+def test_slot_times_out_when_full():
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+    with limiter.slot():
+        with pytest.raises(TimeoutError):
+            with limiter.slot(timeout=0.01):
+                pass
+
+
+def _expire(limiter, phase):
+    deadline = Deadline(0.01)
+    time.sleep(0.02)
+    with pytest.raises(DeadlineExceeded):
+        with limiter.slot():
+            deadline.seconds(phase)
+
+
+def test_deadline_spent_waiting_on_the_browser_counts_as_congestion():
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=8)
+    _expire(limiter, "response_start")
+    assert limiter.limit == 2
+    assert limiter.snapshot()["errors"] == 1
+
+
+def test_deadline_spent_in_the_queue_is_not_counted():
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=8)
+    _expire(limiter, "queue")
+    assert limiter.limit == 4
+    assert limiter.snapshot()["errors"] == 0
@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from utils.deadline import Deadline, DeadlineExceeded, phase, seconds
+
+
+def test_rejects_non_positive_budget():
+    with pytest.raises(ValueError):
+        Deadline(0)
+
+
+def test_seconds_is_capped_by_remaining_budget():
+    deadline = Deadline(5.0)
+    assert deadline.seconds("open", 1.0) == 1.0
+    assert 4.0 < deadline.seconds("open", 60.0) <= 5.0
+    assert 4.0 < deadline.seconds("open") <= 5.0
+
+
+def test_seconds_raises_once_spent():
+    deadline = Deadline(0.01)
+    time.sleep(0.02)
+    assert deadline.expired()
+    with pytest.raises(DeadlineExceeded) as info:
+        deadline.seconds("send")
+    assert info.value.phase == "send"
+    assert isinstance(info.value, TimeoutError)
+
+
+def test_phase_records_time_spent():
+    deadline = Deadline(5.0)
+    with deadline.phase("open"):
+        time.sleep(0.01)
+    with deadline.phase("open"):
+        pass
+    assert set(deadline.spent) == {"open"}
+    assert deadline.spent["open"] >= 0.01
+
+
+def test_phase_blames_failures_after_expiry():
+    deadline = Deadline(0.01)
+    with pytest.raises(DeadlineExceeded) as info:
+        with deadline.phase("response_start"):
+            time.sleep(0.02)
+            raise RuntimeError("element not found")
+    assert info.value.phase == "response_start"
+    assert "response_start" in info.value.spent
+    assert isinstance(info.value.__cause__, RuntimeError)
+
+
+def test_phase_passes_through_failures_before_expiry():
+    deadline = Deadline(5.0)
+    with pytest.raises(RuntimeError):
+        with deadline.phase("send"):
+            raise RuntimeError("boom")
+    assert "send" in deadline.spent
+
+
+def test_helpers_without_a_deadline():
+    with phase(None, "open"):
+        pass
+    assert seconds(None, "open", 30) == 30
+    assert seconds(None, "open", None) is None
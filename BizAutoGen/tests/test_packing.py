@@ -0,0 +1,72 @@
+import time
+
+from utils.concurrency import AdaptiveLimiter
+from utils.deadline import DeadlineExceeded
+from utils.packing import pack_prompts, run_packed, split_packed
+from utils.parser import JSON_ONLY_INSTRUCTION
+
+
+def test_pack_prompts_numbers_each_request():
+    packed = pack_prompts(["First idea ", "Second idea"])
+    assert "2 independent requests" in packed
+    assert "=== REQUEST 1 ===\nFirst idea\n" in packed
+    assert "=== REQUEST 2 ===\nSecond idea" in packed
+
+
+def test_split_packed_returns_answers_by_index():
+    raw = "=== RESULT 1 ===\nAlpha\n\n## RESULT 2\nBeta\n**RESULT 3**\nGamma"
+    assert split_packed(raw, 3) == {0: "Alpha", 1: "Beta", 2: "Gamma"}
+
+
+def test_split_packed_drops_unusable_answers():
+    raw = (
+        "Sure, here you go.\n"
+        "=== RESULT 1 ===\nAlpha\n"
+        "=== RESULT 2 ===\n\n"
+        "=== RESULT 3 ===\nGamma\n"
+        "=== RESULT 3 ===\nGamma again\n"
+        "=== RESULT 9 ===\nOut of range"
+    )
+    assert split_packed(raw, 3) == {0: "Alpha"}
+
+
+def test_marker_must_be_on_its_own_line():
+    raw = "=== RESULT 1 ===\nSee RESULT 2 below\n=== RESULT 2 ===\nBeta"
+    assert split_packed(raw, 2) == {0: "See RESULT 2 below", 1: "Beta"}
+
+
+def test_split_packed_without_markers():
+    assert split_packed("No markers at all", 2) == {}
+
+
+def test_structured_prompts_allow_the_markers():
+    packed = pack_prompts([f"Idea {n}.\n{JSON_ONLY_INSTRUCTION} matching this schema:\n{{}}" for n in (1, 2)])
+    assert JSON_ONLY_INSTRUCTION not in packed
+    assert packed.count("After this request's RESULT line, answer with a single JSON object") == 2
+    assert "the RESULT lines are the only other text allowed" in packed
+
+
+def test_retries_draw_on_the_remaining_batch_budget():
+    budgets = {}
+
+    def single(index, remaining):
+        budgets[index] = remaining
+        time.sleep(0.1)
+        return index
+
+    results = run_packed(
+        ["a", "b"],
+        str,
+        single,
+        kind="pricing",
+        label="Test",
+        error_message="failed",
+        pack_size=1,
+        limiter=AdaptiveLimiter(initial_limit=1, max_limit=1),
+        deadline=0.05,
+    )
+    assert results[0] == 0
+    assert 0 < budgets[0] <= 0.05
+    # The first retry spent the whole budget, so the second never starts.
+    assert isinstance(results[1], DeadlineExceeded)
+    assert 1 not in budgets
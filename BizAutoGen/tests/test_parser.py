@@ -0,0 +1,163 @@
+import json
+
+import pytest
+
+from utils.parser import (
+    merge_continuation,
+    missing_sections,
+    parse_pricing,
+    parse_stats,
+    parse_swot,
+    reset_parse_stats,
+)
+
+PLAN_SECTIONS = (
+    "Executive Summary",
+    "Market Analysis",
+    "Product/Service Offering",
+    "Marketing Strategy",
+    "Operations Plan",
+    "Financial Projections",
+    "Key Milestones",
+)
+
+
+HEADING_FORMATS = [
+    "{heading}:\n{body}",
+    "{number}. {heading}\n{body}",
+    "{number}. {heading}:\n{body}",
+    "## {number}. {heading}\n{body}",
+    "### {heading}\n{body}",
+    "**{heading}:**\n{body}",
+    "**{heading}**\n{body}",
+]
+
+
+@pytest.mark.parametrize("template", HEADING_FORMATS)
+def test_plan_headings_in_common_formats_are_found(template):
+    plan = "\n\n".join(
+        template.format(number=number, heading=heading, body=f"Details about {heading.lower()}.")
+        for number, heading in enumerate(PLAN_SECTIONS, start=1)
+    )
+    assert missing_sections("plan", plan) == []
+
+
+@pytest.mark.parametrize("template", HEADING_FORMATS)
+def test_swot_sections_in_common_formats_are_parsed(template):
+    sections = [
+        ("Strengths", "- Loyal customers\n- Good location"),
+        ("Weaknesses", "- Small team"),
+        ("Opportunities", "1. Delivery\n2. Catering"),
+        ("Threats", "- Chains"),
+        ("Market Potential", "Growing fast."),
+        ("Recommendations", "- Hire\n- Advertise"),
+    ]
+    raw = "\n\n".join(
+        template.format(number=number, heading=heading, body=body)
+        for number, (heading, body) in enumerate(sections, start=1)
+    )
+    assert missing_sections("swot", raw) == []
+    assert parse_swot(raw) == {
+        "swot": {
+            "strengths": ["Loyal customers", "Good location"],
+            "weaknesses": ["Small team"],
+            "opportunities": ["Delivery", "Catering"],
+            "threats": ["Chains"],
+        },
+        "market_potential": "Growing fast.",
+        "recommendations": ["Hire", "Advertise"],
+    }
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "Recommended Price: $20\nStrategy: Value\nRationale: Cheap inputs",
+        "**Recommended Price:** $20\n**Strategy:** Value\n**Rationale:** Cheap inputs",
+        "## Recommended Price\n$20\n## Strategy\nValue\n## Rationale\nCheap inputs",
+        "1. Recommended Price: $20\n2. Strategy\nValue\n3. Rationale\nCheap inputs",
+    ],
+)
+def test_pricing_headings_in_common_formats_are_parsed(raw):
+    assert missing_sections("pricing", raw) == []
+    assert parse_pricing(raw) == {"recommended_price": "$20", "strategy": "Value", "rationale": "Cheap inputs"}
+
+
+def test_truncated_plan_reports_the_missing_sections():
+    plan = "1. Executive Summary\nA bakery.\n\n2. Market Analysis\nBusy street."
+    assert missing_sections("plan", plan) == [
+        "offering",
+        "marketing_strategy",
+        "operations_plan",
+        "financial_projections",
+        "key_milestones",
+    ]
+
+
+def test_swot_sections_stop_at_the_next_heading():
+    raw = (
+        "**Strengths:**\n- Loyal customers\n**Weaknesses:**\n- Small team\n"
+        "Opportunities:\n- Delivery\nThreats:\n- Chains\n"
+        "Market Potential: Growing\nRecommendations:\n- Hire"
+    )
+    assert missing_sections("swot", raw) == []
+    result = parse_swot(raw)
+    assert result["swot"]["strengths"] == ["Loyal customers"]
+    assert result["swot"]["weaknesses"] == ["Small team"]
+
+
+def test_structured_continuation_merges_keys():
+    merged = merge_continuation('{"ad_copy": "Buy now"}', '{"blog_intro": "Welcome"}', structured=True)
+    assert missing_sections("marketing", merged, structured=True) == ["social_caption"]
+
+
+@pytest.fixture
+def stats():
+    reset_parse_stats()
+    yield parse_stats
+    reset_parse_stats()
+
+
+def test_complete_json_takes_the_json_path(stats):
+    raw = json.dumps(
+        {
+            "swot": {"strengths": ["Fast"], "weaknesses": ["Small"], "opportunities": ["Delivery"], "threats": ["Chains"]},
+            "market_potential": "Growing",
+            "recommendations": ["Hire", "Advertise", "Expand", "Extra"],
+        }
+    )
+    result = parse_swot(f"```json\n{raw}\n```", structured=True)
+    assert result["swot"]["threats"] == ["Chains"]
+    assert result["recommendations"] == ["Hire", "Advertise", "Expand"]
+    assert stats() == {"swot.json": 1}
+
+
+def test_partial_json_keeps_the_fields_it_has(stats):
+    raw = json.dumps(
+        {
+            "swot": {"strengths": ["Fast"], "weaknesses": ["Small"], "opportunities": ["Delivery"], "threats": []},
+            "market_potential": "Growing",
+            "recommendations": ["Hire"],
+        }
+    )
+    result = parse_swot(raw, structured=True)
+    assert result == {
+        "swot": {"strengths": ["Fast"], "weaknesses": ["Small"], "opportunities": ["Delivery"], "threats": []},
+        "market_potential": "Growing",
+        "recommendations": ["Hire"],
+    }
+    pricing = parse_pricing('{"recommended_price": 19.99, "strategy": "s", "rationale": ""}', structured=True)
+    assert pricing == {"recommended_price": "19.99", "strategy": "s", "rationale": ""}
+    assert stats() == {"swot.json_partial": 1, "pricing.json_partial": 1}
+
+
+def test_invalid_json_falls_back_to_headings(stats):
+    raw = "Recommended Price: $20\nStrategy: Value\nRationale: Cheap inputs"
+    result = parse_pricing(raw, structured=True)
+    assert result == {"recommended_price": "$20", "strategy": "Value", "rationale": "Cheap inputs"}
+    assert stats() == {"pricing.json_invalid": 1, "pricing.regex": 1}
+
+
+def test_regex_path_is_counted(stats):
+    parse_pricing("Recommended Price: $20", structured=False)
+    assert stats() == {"pricing.regex": 1}
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utils.profiles import ProfilePool
+
+
+def test_profiles_are_never_shared(tmp_path):
+    pool = ProfilePool(str(tmp_path), size=2)
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first.path != second.path
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+    first.release()
+    assert pool.acquire(timeout=0.01).path == first.path
+
+
+def test_pools_in_one_process_respect_each_others_locks(tmp_path):
+    held = ProfilePool(str(tmp_path), size=1).acquire()
+    with pytest.raises(TimeoutError):
+        ProfilePool(str(tmp_path), size=1).acquire(timeout=0.01)
+    held.release()
+
+
+def test_reset_skips_busy_profiles_and_deletes_the_rest(tmp_path):
+    pool = ProfilePool(str(tmp_path), size=2)
+    busy = pool.acquire()
+    os.makedirs(tmp_path / "profile-1")
+    assert pool.reset() == [busy.path]
+    assert (tmp_path / "profile-0").is_dir()
+    assert not (tmp_path / "profile-1").exists()
+    busy.release()
+    assert pool.reset() == []
+    assert not (tmp_path / "profile-0").exists()
+    assert pool.acquire(timeout=0.01).path == busy.path
+
+
+def test_lock_of_a_dead_process_is_free(tmp_path):
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); from utils.profiles import ProfilePool; "
+        "ProfilePool(sys.argv[2], size=1).acquire(); print('locked')"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", code, root, str(tmp_path)], capture_output=True, text=True)
+    assert result.stdout.strip() == "locked"
+    assert ProfilePool(str(tmp_path), size=1).acquire(timeout=0.01).path == str(tmp_path / "profile-0")
+
+
+def test_stale_browser_locks_are_cleared_from_idle_profiles(tmp_path):
+    pool = ProfilePool(str(tmp_path), size=2)
+    for index in range(2):
+        os.makedirs(tmp_path / f"profile-{index}")
+        (tmp_path / f"profile-{index}" / "SingletonLock").write_text("")
+    busy = pool.acquire()
+    (tmp_path / "profile-0" / "SingletonLock").write_text("")
+    assert pool.clean_stale_locks() == [str(tmp_path / "profile-1")]
+    assert (tmp_path / "profile-0" / "SingletonLock").exists()
+    assert not (tmp_path / "profile-1" / "SingletonLock").exists()
+    busy.release()
@@ -1,19 +1,41 @@
 """Utility helpers for BizAutoGen."""
 
 from .browser import SeleniumBrowser
+from .cassette import RecordingPool, ReplayPool
+from .concurrency import AdaptiveLimiter, default_limiter, run_concurrently
+from .deadline import Deadline, DeadlineExceeded
 from .parser import (
     clean_output,
+    missing_sections,
+    parse_automation,
     parse_marketing,
     parse_plan,
     parse_pricing,
+    parse_stats,
     parse_swot,
+    reset_parse_stats,
 )
+from .pool import BrowserPool
+from .profiles import ProfilePool
 
 __all__ = [
+    "AdaptiveLimiter",
+    "BrowserPool",
+    "Deadline",
+    "DeadlineExceeded",
+    "ProfilePool",
+    "RecordingPool",
+    "ReplayPool",
     "SeleniumBrowser",
+    "default_limiter",
+    "run_concurrently",
     "clean_output",
+    "missing_sections",
+    "parse_automation",
     "parse_marketing",
     "parse_plan",
     "parse_pricing",
+    "parse_stats",
     "parse_swot",
+    "reset_parse_stats",
 ]
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, WebDriverException
@@ -14,11 +15,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
+from .deadline import Deadline, phase, seconds
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -58,17 +60,23 @@ class SeleniumBrowser:
         headless: bool = False,
         browser: str = "chrome",
         timeout: int = 60,
+        user_data_dir: Optional[str] = None,
     ) -> None:
         self.headless = headless
         self.browser = browser.lower()
         self.timeout = timeout
+        self.user_data_dir = user_data_dir
         self._driver = self._initialise_driver()
         self._wait = WebDriverWait(self._driver, timeout)
         self._previous_response_snapshot: List[str] = []
+        # Seconds spent in each phase of the most recent interaction; the
+        # ``response_start`` entry measures submit-to-first-output latency.
+        self.timings: Dict[str, float] = {}
         LOGGER.debug(
-            "Initialized SeleniumBrowser (browser=%s, headless=%s)",
+            "Initialized SeleniumBrowser (browser=%s, headless=%s, profile=%s)",
             self.browser,
             headless,
+            user_data_dir or "temporary",
         )
 
     def __enter__(self) -> "SeleniumBrowser":
@@ -87,6 +95,8 @@ class SeleniumBrowser:
             options.add_argument("--disable-gpu")
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
+            if self.user_data_dir:
+                options.add_argument(f"--user-data-dir={self.user_data_dir}")
             service = EdgeService(EdgeChromiumDriverManager().install())
             driver = webdriver.Edge(service=service, options=options)
         else:
@@ -97,61 +107,122 @@ class SeleniumBrowser:
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--window-size=1440,900")
+            if self.user_data_dir:
+                options.add_argument(f"--user-data-dir={self.user_data_dir}")
             service = ChromeService(ChromeDriverManager().install())
             driver = webdriver.Chrome(service=service, options=options)
         driver.set_page_load_timeout(self.timeout)
         return driver
 
-    def open_cto_new(self) -> None:
+    def open_cto_new(self, deadline: Optional[Deadline] = None) -> None:
         """Navigate to cto.new and wait for the prompt input to be ready."""
         LOGGER.info("Opening cto.new")
-        self._driver.get(self.CTO_NEW_URL)
-        self._wait_for_prompt()
-        self._previous_response_snapshot = self._collect_response_texts()
+        started = time.perf_counter()
+        with phase(deadline, "open"):
+            budget = seconds(deadline, "open", self.timeout)
+            self._driver.set_page_load_timeout(budget)
+            self._driver.get(self.CTO_NEW_URL)
+            self._wait_for_prompt(wait=WebDriverWait(self._driver, seconds(deadline, "open", budget)))
+            self._previous_response_snapshot = self._collect_response_texts()
+        self.timings["open"] = time.perf_counter() - started
+
+    def send_prompt(
+        self,
+        prompt: str,
+        wait_time: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> None:
+        """Send a prompt to cto.new and wait for the request to start processing.
 
-    def send_prompt(self, prompt: str, wait_time: Optional[int] = None) -> None:
-        """Send a prompt to cto.new and wait for the request to start processing."""
+        Every wait is capped by ``wait_time`` (the browser timeout by default)
+        and by whatever is left of ``deadline``.
+        """
         if not prompt.strip():
             raise ValueError("Prompt cannot be empty")
 
-        wait = WebDriverWait(self._driver, wait_time or self.timeout)
-        self._wait_for_prompt(wait=wait)
-        prompt_area = self._locate_first_visible(self.PROMPT_SELECTORS)
-        if prompt_area is None:
-            raise TimeoutException("Prompt input could not be located on cto.new")
-
-        self._previous_response_snapshot = self._collect_response_texts()
-        LOGGER.debug("Sending prompt (%s characters)", len(prompt))
-        prompt_area.clear()
-        prompt_area.send_keys(prompt)
-
-        if not self._click_submit_button(wait):
-            LOGGER.debug("Falling back to keyboard submission")
-            key_combinations = (
-                (Keys.CONTROL, Keys.RETURN),
-                (Keys.CONTROL, Keys.ENTER),
-                (Keys.COMMAND, Keys.RETURN),
-            )
-            for combo in key_combinations:
-                try:
-                    prompt_area.send_keys(*combo)
-                except Exception:  # pragma: no cover - defensive fallback
-                    LOGGER.debug("Key combination %s failed during submission", combo)
-            prompt_area.send_keys(Keys.ENTER)
-
-        wait.until(self._response_started())
-
-    def extract_response(self, wait_time: Optional[int] = None) -> str:
+        cap = wait_time or self.timeout
+        started = time.perf_counter()
+        with phase(deadline, "send"):
+            self._wait_for_prompt(wait=WebDriverWait(self._driver, seconds(deadline, "send", cap)))
+            prompt_area = self._locate_first_visible(self.PROMPT_SELECTORS)
+            if prompt_area is None:
+                raise TimeoutException("Prompt input could not be located on cto.new")
+
+            self._previous_response_snapshot = self._collect_response_texts()
+            LOGGER.debug("Sending prompt (%s characters)", len(prompt))
+            prompt_area.clear()
+            prompt_area.send_keys(prompt)
+
+            if not self._click_submit_button(WebDriverWait(self._driver, seconds(deadline, "send", cap))):
+                LOGGER.debug("Falling back to keyboard submission")
+                key_combinations = (
+                    (Keys.CONTROL, Keys.RETURN),
+                    (Keys.CONTROL, Keys.ENTER),
+                    (Keys.COMMAND, Keys.RETURN),
+                )
+                for combo in key_combinations:
+                    try:
+                        prompt_area.send_keys(*combo)
+                    except Exception:  # pragma: no cover - defensive fallback
+                        LOGGER.debug("Key combination %s failed during submission", combo)
+                prompt_area.send_keys(Keys.ENTER)
+
+        submitted = time.perf_counter()
+        self.timings["send"] = submitted - started
+        with phase(deadline, "response_start"):
+            WebDriverWait(self._driver, seconds(deadline, "response_start", cap)).until(self._response_started())
+        self.timings["response_start"] = time.perf_counter() - submitted
+
+    def extract_response(
+        self,
+        wait_time: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> str:
         """Extract the latest response text from cto.new."""
-        wait = WebDriverWait(self._driver, wait_time or self.timeout)
-        try:
-            response_text = wait.until(self._response_ready())
-        except TimeoutException as exc:  # pragma: no cover - depends on live site
-            LOGGER.error("Timed out waiting for response from cto.new")
-            raise exc
+        started = time.perf_counter()
+        with phase(deadline, "extract"):
+            wait = WebDriverWait(self._driver, seconds(deadline, "extract", wait_time or self.timeout))
+            try:
+                response_text = wait.until(self._response_ready())
+            except TimeoutException as exc:  # pragma: no cover - depends on live site
+                LOGGER.error("Timed out waiting for response from cto.new")
+                raise exc
+        self.timings["extract"] = time.perf_counter() - started
         LOGGER.debug("Received response with %s characters", len(response_text))
         return response_text
 
+    def wait_for_stable_response(
+        self,
+        stable_for: float = 2.0,
+        wait_time: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> str:
+        """Wait until the latest response text stops changing and return it.
+
+        Use this when the text returned by :meth:`extract_response` may have
+        been captured while cto.new was still rendering.
+        """
+        state = {"text": None, "since": time.monotonic()}
+
+        def _condition(driver):
+            text = self._latest_response_text()
+            now = time.monotonic()
+            if text != state["text"]:
+                state["text"], state["since"] = text, now
+                return False
+            return text if text and now - state["since"] >= stable_for else False
+
+        started = time.perf_counter()
+        with phase(deadline, "stabilise"):
+            wait = WebDriverWait(
+                self._driver,
+                seconds(deadline, "stabilise", wait_time or self.timeout),
+                poll_frequency=0.5,
+            )
+            response_text = wait.until(_condition)
+        self.timings["stabilise"] = time.perf_counter() - started
+        return response_text
+
     def close(self) -> None:
         """Close the browser session."""
         if getattr(self, "_driver", None):
@@ -185,14 +256,16 @@ class SeleniumBrowser:
 
     def _response_ready(self):
         def _condition(driver):
-            current_texts = self._collect_response_texts()
-            for text in current_texts:
-                if text and text not in self._previous_response_snapshot:
-                    return text
-            return False
+            return self._latest_response_text() or False
 
         return _condition
 
+    def _latest_response_text(self) -> Optional[str]:
+        for text in self._collect_response_texts():
+            if text and text not in self._previous_response_snapshot:
+                return text
+        return None
+
     def _locate_first_visible(self, selectors: Sequence[_Selector]):
         for selector in selectors:
             elements = self._driver.find_elements(selector.by, selector.value)
@@ -202,14 +275,21 @@ class SeleniumBrowser:
         return None
 
     def _click_submit_button(self, wait: WebDriverWait) -> bool:
-        for selector in self.SUBMIT_SELECTORS:
-            try:
-                button = wait.until(EC.element_to_be_clickable((selector.by, selector.value)))
-                button.click()
-                return True
-            except TimeoutException:
-                continue
-        return False
+        # Poll every selector within one shared wait instead of giving each
+        # selector its own full timeout.
+        try:
+            button = wait.until(self._submit_available())
+        except TimeoutException:
+            return False
+        button.click()
+        return True
+
+    def _submit_available(self):
+        def _condition(driver):
+            element = self._locate_first_visible(self.SUBMIT_SELECTORS)
+            return element if element is not None else False
+
+        return _condition
 
     def _collect_response_texts(self) -> List[str]:
         texts: List[str] = []
@@ -0,0 +1,147 @@
+"""Bulk re-parsing of archived raw responses on a process pool."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import time
+from collections import Counter, deque
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .parser import PARSE_STATS, PARSERS
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SQLITE_QUERY = "SELECT * FROM responses"
+
+
+def read_jsonl(path: str, default_kind: Optional[str] = None) -> Iterator[dict]:
+    """Stream records from a JSON Lines file.
+
+    Each line needs a ``response`` field and, unless ``default_kind`` is
+    given, a ``kind``; ``id`` defaults to the line number. Lines that are not
+    a JSON object, or have no response, are passed on with an ``error`` and
+    reported per record.
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                yield {"id": line_number, "kind": default_kind, "error": f"Invalid JSON: {exc}"}
+                continue
+            if not isinstance(record, dict):
+                yield {"id": line_number, "kind": default_kind, "error": "Record must be a JSON object"}
+                continue
+            yield _normalise(record, line_number, default_kind)
+
+
+def read_sqlite(path: str, query: str = DEFAULT_SQLITE_QUERY, default_kind: Optional[str] = None) -> Iterator[dict]:
+    """Stream records from a SQLite query returning ``response`` (and optionally ``id``, ``kind``, ``structured``)."""
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    try:
+        for row_number, row in enumerate(connection.execute(query), start=1):
+            yield _normalise(dict(row), row_number, default_kind)
+    finally:
+        connection.close()
+
+
+def reparse(
+    records: Iterable[dict],
+    output: TextIO,
+    *,
+    workers: Optional[int] = None,
+    batch_size: int = 500,
+    progress_every: float = 5.0,
+) -> Dict[str, object]:
+    """Parse ``records`` across ``workers`` processes and write results as JSON Lines.
+
+    Batches are submitted with at most two in flight per worker and written
+    back in input order, so memory stays bounded however large the archive.
+    Returns the totals, throughput and aggregated parse path counters.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    totals: Counter = Counter()
+    stats: Counter = Counter()
+    started = last_report = time.perf_counter()
+
+    def _drain(result: Tuple[List[dict], Dict[str, int]]) -> None:
+        nonlocal last_report
+        lines, batch_stats = result
+        for item in lines:
+            output.write(json.dumps(item, ensure_ascii=False) + "\n")
+            totals["errors" if "error" in item else "parsed"] += 1
+        stats.update(batch_stats)
+        now = time.perf_counter()
+        if now - last_report >= progress_every:
+            last_report = now
+            done = totals["parsed"] + totals["errors"]
+            LOGGER.info("Re-parsed %s records (%.0f records/s)", done, done / (now - started))
+
+    with multiprocessing.Pool(workers) as pool:
+        pending: deque = deque()
+        for batch in _batched(records, batch_size):
+            pending.append(pool.apply_async(_parse_batch, (batch,)))
+            if len(pending) >= max_pending:
+                _drain(pending.popleft().get())
+        while pending:
+            _drain(pending.popleft().get())
+
+    elapsed = time.perf_counter() - started
+    processed = totals["parsed"] + totals["errors"]
+    return {
+        "records": processed,
+        "parsed": totals["parsed"],
+        "errors": totals["errors"],
+        "seconds": round(elapsed, 3),
+        "records_per_second": round(processed / elapsed, 1) if elapsed else 0.0,
+        "parse_stats": dict(stats),
+    }
+
+
+def _normalise(record: dict, position: int, default_kind: Optional[str]) -> dict:
+    normalised = {"id": record.get("id", position), "kind": record.get("kind") or default_kind}
+    response = record.get("response")
+    if not isinstance(response, str) or not response.strip():
+        normalised["error"] = "Record has no response"
+        return normalised
+    normalised["response"] = response
+    normalised["structured"] = bool(record.get("structured", False))
+    return normalised
+
+
+def _batched(records: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    iterator = iter(records)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _parse_batch(batch: List[dict]) -> Tuple[List[dict], Dict[str, int]]:
+    PARSE_STATS.clear()
+    results: List[dict] = []
+    for record in batch:
+        if "error" in record:
+            results.append(record)
+            continue
+        parser = PARSERS.get(record["kind"])
+        if parser is None:
+            results.append({"id": record["id"], "kind": record["kind"], "error": f"Unknown kind {record['kind']!r}"})
+            continue
+        try:
+            result = parser(record["response"], structured=record["structured"])
+        except Exception as exc:  # pragma: no cover - reported per record
+            results.append({"id": record["id"], "kind": record["kind"], "error": str(exc)})
+            continue
+        results.append({"id": record["id"], "kind": record["kind"], "result": result})
+    return results, dict(PARSE_STATS)
@@ -0,0 +1,256 @@
+"""Record/replay cassettes for the browser layer.
+
+A cassette is a JSON Lines file (gzip-compressed when the name ends in
+``.gz``) with one exchange per line: the prompt sent to cto.new, every
+response text read back after it, and the per-phase timings measured by
+:class:`~utils.browser.SeleniumBrowser`::
+
+    {"prompt": "...", "timings": {"open": 1.9, "send": 0.4, "response_start": 2.1},
+     "outputs": [["extract", "Strengths: ...", 6.3]]}
+
+:class:`RecordingPool` captures cassettes from live sessions and
+:class:`ReplayPool` serves them back, either instantly or with the recorded
+latency. Both are browser pools, so they plug in wherever a ``pool`` is
+accepted.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, TextIO
+
+from .deadline import Deadline, phase, seconds
+from .pool import BrowserPool
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _open(path: str, mode: str) -> TextIO:
+    if path.endswith(".gz"):
+        return gzip.open(path, f"{mode}t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    """Recorded exchanges indexed by prompt, replayed round-robin per prompt."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._exchanges: Dict[str, List[dict]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        with _open(path, "r") as handle:
+            for line in handle:
+                if line.strip():
+                    exchange = json.loads(line)
+                    self._exchanges.setdefault(exchange["prompt"], []).append(exchange)
+        LOGGER.info("Loaded %s recorded exchange(s) from %s", len(self), path)
+
+    def __len__(self) -> int:
+        return sum(len(exchanges) for exchanges in self._exchanges.values())
+
+    def next_exchange(self, prompt: str) -> dict:
+        exchanges = self._exchanges.get(prompt)
+        if not exchanges:
+            raise LookupError(f"No recorded response for this prompt in {self.path}")
+        with self._lock:
+            index = self._cursor.get(prompt, 0)
+            self._cursor[prompt] = index + 1
+        return exchanges[index % len(exchanges)]
+
+
+class CassetteWriter:
+    """Thread-safe appender of exchanges to a cassette file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._handle: Optional[TextIO] = _open(path, "a")
+        self._lock = threading.Lock()
+
+    def write(self, exchange: dict) -> None:
+        line = json.dumps(exchange, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if self._handle is None:
+                LOGGER.warning("Dropping exchange recorded after %s was closed", self.path)
+                return
+            self._handle.write(line + "\n")
+            self._handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+class RecordingBrowser:
+    """Proxy around a live browser that writes each exchange to a cassette."""
+
+    def __init__(self, browser, writer: CassetteWriter) -> None:
+        self._browser = browser
+        self._writer = writer
+        self._exchange: Optional[dict] = None
+        self._opened = False
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        return self._browser.timings
+
+    def __enter__(self) -> "RecordingBrowser":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def open_cto_new(self, deadline: Optional[Deadline] = None) -> None:
+        self.flush()
+        self._browser.open_cto_new(deadline=deadline)
+        self._opened = True
+
+    def send_prompt(self, prompt: str, wait_time: Optional[int] = None, deadline: Optional[Deadline] = None) -> None:
+        self.flush()
+        self._browser.send_prompt(prompt, wait_time=wait_time, deadline=deadline)
+        # Page load time belongs to the first prompt after opening cto.new only.
+        names = ("open", "send", "response_start") if self._opened else ("send", "response_start")
+        self._opened = False
+        self._exchange = {
+            "prompt": prompt,
+            "timings": {name: round(self.timings[name], 4) for name in names if name in self.timings},
+            "outputs": [],
+        }
+
+    def extract_response(self, wait_time: Optional[int] = None, deadline: Optional[Deadline] = None) -> str:
+        text = self._browser.extract_response(wait_time=wait_time, deadline=deadline)
+        self._record("extract", text)
+        return text
+
+    def wait_for_stable_response(
+        self,
+        stable_for: float = 2.0,
+        wait_time: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> str:
+        text = self._browser.wait_for_stable_response(stable_for=stable_for, wait_time=wait_time, deadline=deadline)
+        self._record("stabilise", text)
+        return text
+
+    def close(self) -> None:
+        self.flush()
+        self._browser.close()
+
+    def _record(self, name: str, text: str) -> None:
+        if self._exchange is not None:
+            self._exchange["outputs"].append([name, text, round(self.timings.get(name, 0.0), 4)])
+
+    def flush(self) -> None:
+        """Write out the exchange in progress, if it has any output yet."""
+        if self._exchange is not None and self._exchange["outputs"]:
+            self._writer.write(self._exchange)
+        self._exchange = None
+
+
+class ReplayBrowser:
+    """Stand-in for :class:`SeleniumBrowser` that answers from a cassette."""
+
+    def __init__(self, cassette: Cassette, realtime: bool = False) -> None:
+        self.cassette = cassette
+        self.realtime = realtime
+        self.timings: Dict[str, float] = {}
+        self._outputs: List[list] = []
+        self._last: Optional[str] = None
+
+    def __enter__(self) -> "ReplayBrowser":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def open_cto_new(self, deadline: Optional[Deadline] = None) -> None:
+        self.timings = {}
+        self._outputs = []
+        self._last = None
+
+    def send_prompt(self, prompt: str, wait_time: Optional[int] = None, deadline: Optional[Deadline] = None) -> None:
+        if not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+        exchange = self.cassette.next_exchange(prompt)
+        for name, recorded in exchange.get("timings", {}).items():
+            self._pause(name, recorded, deadline)
+            self.timings[name] = recorded
+        self._outputs = list(exchange["outputs"])
+
+    def extract_response(self, wait_time: Optional[int] = None, deadline: Optional[Deadline] = None) -> str:
+        return self._next_output(deadline)
+
+    def wait_for_stable_response(
+        self,
+        stable_for: float = 2.0,
+        wait_time: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> str:
+        return self._next_output(deadline)
+
+    def close(self) -> None:
+        self._outputs = []
+
+    def _next_output(self, deadline: Optional[Deadline]) -> str:
+        if self._outputs:
+            name, text, recorded = self._outputs.pop(0)
+            self._pause(name, recorded, deadline)
+            self.timings[name] = recorded
+            self._last = text
+        if self._last is None:
+            raise TimeoutError("Cassette holds no response for the last prompt")
+        return self._last
+
+    def _pause(self, name: str, recorded: float, deadline: Optional[Deadline]) -> None:
+        if not self.realtime or not recorded:
+            return
+        with phase(deadline, name):
+            allowed = seconds(deadline, name, recorded)
+            time.sleep(allowed)
+            if allowed < recorded:
+                raise TimeoutError(f"Recorded {name} phase outlasted the remaining budget")
+
+
+class RecordingPool(BrowserPool):
+    """Browser pool whose live sessions are recorded to a cassette."""
+
+    def __init__(self, path: str, size: int = 1, **kwargs) -> None:
+        super().__init__(size, **kwargs)
+        self.writer = CassetteWriter(path)
+
+    @contextmanager
+    def browser(self, timeout: Optional[float] = None) -> Iterator[RecordingBrowser]:
+        # Write each exchange when its request ends rather than when the
+        # browser is next used, which may be never for sessions still lent
+        # out when the pool closes.
+        with super().browser(timeout) as instance:
+            try:
+                yield instance
+            finally:
+                instance.flush()
+
+    def _new_browser(self, user_data_dir: Optional[str]):
+        return RecordingBrowser(super()._new_browser(user_data_dir), self.writer)
+
+    def close(self) -> None:
+        super().close()
+        self.writer.close()
+
+
+class ReplayPool(BrowserPool):
+    """Browser pool that serves recorded responses instead of launching browsers."""
+
+    def __init__(self, path: str, size: int = 8, realtime: bool = False) -> None:
+        super().__init__(size)
+        self.cassette = Cassette(path)
+        self.realtime = realtime
+
+    def _new_browser(self, user_data_dir: Optional[str]):
+        return ReplayBrowser(self.cassette, self.realtime)
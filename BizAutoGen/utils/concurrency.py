@@ -0,0 +1,202 @@
+"""Adaptive concurrency control for parallel cto.new browser sessions."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from .deadline import DeadlineExceeded
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Failures that indicate cto.new (or the local machine) is overloaded. Anything
+# else, such as a validation error, says nothing about capacity. A deadline
+# that runs out while waiting on the browser counts too; one that runs out
+# while still queued for a browser does not.
+CONGESTION_ERRORS = (TimeoutException, WebDriverException, TimeoutError)
+_QUEUE_PHASE = "queue"
+
+
+class AdaptiveLimiter:
+    """AIMD limiter for the number of in-flight browser requests.
+
+    The limit grows by roughly one slot per window of successful requests and
+    is cut multiplicatively on a timeout/driver error or when the
+    response-start latency drifts past ``latency_tolerance`` times the best
+    latency among the last ``latency_window`` samples, so a single unusually
+    fast response stops counting once it ages out. Only one decrease is
+    applied per congestion event: samples from requests that started before
+    the last cut are ignored.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 8,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        latency_window: int = 50,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("Backoff must be between 0 and 1")
+        if latency_window < 1:
+            raise ValueError("Latency window must hold at least one sample")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._successes = 0
+        self._errors = 0
+        self._latency_ewma: Optional[float] = None
+        self._latency_samples: deque = deque(maxlen=latency_window)
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return the limiter metrics for logging or export."""
+        with self._condition:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "successes": self._successes,
+                "errors": self._errors,
+                "latency_ewma": self._latency_ewma,
+                "latency_floor": self._latency_floor(),
+            }
+
+    @contextmanager
+    def slot(self, timeout: Optional[float] = None) -> Iterator["_Slot"]:
+        """Hold one in-flight slot for the duration of a browser request.
+
+        Report the response-start latency through :meth:`_Slot.record`; an
+        exception listed in ``CONGESTION_ERRORS`` counts as a failed request,
+        as does :class:`DeadlineExceeded` outside the ``queue`` phase.
+        Raises ``TimeoutError`` if no slot frees up within ``timeout`` seconds.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                raise TimeoutError("Timed out waiting for a concurrency slot")
+            self._in_flight += 1
+        slot = _Slot(time.monotonic())
+        try:
+            yield slot
+        except DeadlineExceeded as exc:
+            self._release(slot, failed=True, count=exc.phase != _QUEUE_PHASE)
+            raise
+        except CONGESTION_ERRORS:
+            self._release(slot, failed=True)
+            raise
+        except BaseException:
+            self._release(slot, failed=False, count=False)
+            raise
+        else:
+            self._release(slot, failed=False)
+
+    def _release(self, slot: "_Slot", failed: bool, count: bool = True) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if count:
+                if failed:
+                    self._errors += 1
+                    self._decrease(slot.started, "error", slot.latency)
+                else:
+                    self._successes += 1
+                    self._observe(slot)
+            self._condition.notify_all()
+
+    def _observe(self, slot: "_Slot") -> None:
+        latency = slot.latency
+        if latency is not None:
+            if self._latency_ewma is None:
+                self._latency_ewma = latency
+            else:
+                self._latency_ewma += self.smoothing * (latency - self._latency_ewma)
+            self._latency_samples.append(latency)
+            if self._latency_ewma > self._latency_floor() * self.latency_tolerance:
+                self._decrease(slot.started, "latency", latency)
+                return
+        if self._limit < self.max_limit:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            LOGGER.debug("Concurrency limit raised to %.2f", self._limit)
+
+    def _latency_floor(self) -> Optional[float]:
+        return min(self._latency_samples) if self._latency_samples else None
+
+    def _decrease(self, started: float, reason: str, latency: Optional[float]) -> None:
+        if started < self._last_decrease:
+            return
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        self._last_decrease = time.monotonic()
+        # Re-anchor the average on the latest sample so one slow burst does
+        # not keep cutting; without a sample, start the average afresh.
+        self._latency_ewma = latency
+        LOGGER.info("Concurrency limit lowered to %s (%s)", int(self._limit), reason)
+
+
+class _Slot:
+    __slots__ = ("started", "latency")
+
+    def __init__(self, started: float) -> None:
+        self.started = started
+        self.latency: Optional[float] = None
+
+    def record(self, latency: Optional[float]) -> None:
+        """Attach the measured response-start latency, in seconds."""
+        self.latency = latency
+
+
+_DEFAULT_LIMITER: Optional[AdaptiveLimiter] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_limiter() -> AdaptiveLimiter:
+    """Return the process-wide limiter shared by all modules."""
+    global _DEFAULT_LIMITER
+    with _DEFAULT_LOCK:
+        if _DEFAULT_LIMITER is None:
+            _DEFAULT_LIMITER = AdaptiveLimiter()
+        return _DEFAULT_LIMITER
+
+
+def run_concurrently(
+    calls: Iterable[Callable[[], T]],
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> List[Union[T, Exception]]:
+    """Run module calls in parallel, returning results (or errors) in order.
+
+    The thread pool is sized for the limiter's ceiling; the limiter itself
+    decides how many of those threads may hold a browser at any moment. The
+    calls must use the same limiter, which the modules do by default.
+    """
+    limiter = limiter or default_limiter()
+    call_list = list(calls)
+
+    def _invoke(call: Callable[[], T]) -> Union[T, Exception]:
+        try:
+            return call()
+        except Exception as exc:  # pragma: no cover - surfaced to the caller
+            return exc
+
+    with ThreadPoolExecutor(max_workers=max(1, min(limiter.max_limit, len(call_list)))) as pool:
+        return list(pool.map(_invoke, call_list))
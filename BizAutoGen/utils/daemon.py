@@ -0,0 +1,149 @@
+"""Long-running BizAutoGen daemon serving module requests over a Unix socket.
+
+The wire protocol is one JSON object per line in each direction. A request
+names a module and its keyword arguments::
+
+    {"module": "idea_validator", "args": {"idea": "Mobile dog grooming"}}
+
+and is answered with ``{"ok": true, "result": ...}`` or
+``{"ok": false, "error": "..."}``. ``{"command": "stats"}`` returns the
+limiter and parser counters.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import threading
+from typing import Callable, Dict, Mapping, Optional
+
+from .concurrency import AdaptiveLimiter
+from .parser import parse_stats
+from .pool import BrowserPool
+
+LOGGER = logging.getLogger(__name__)
+
+# Keyword arguments owned by the daemon rather than the client.
+RESERVED_ARGS = frozenset({"headless", "limiter", "pool", "profiles"})
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "_DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            reply = {"ok": True, "result": self.server.dispatch(json.loads(line))}
+        except Exception as exc:
+            LOGGER.error("Daemon request failed: %s", exc)
+            reply = {"ok": False, "error": str(exc)}
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+class _DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: str,
+        handlers: Mapping[str, Callable[..., object]],
+        pool: BrowserPool,
+        limiter: AdaptiveLimiter,
+        structured: bool,
+        deadline: Optional[float],
+    ) -> None:
+        self.handlers = handlers
+        self.pool = pool
+        self.limiter = limiter
+        self.structured = structured
+        self.deadline = deadline
+        super().__init__(socket_path, _RequestHandler)
+
+    def dispatch(self, request: object) -> object:
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object")
+        if request.get("command") == "stats":
+            return {"limiter": self.limiter.snapshot(), "parse": parse_stats()}
+
+        name = request.get("module")
+        handler = self.handlers.get(name) if isinstance(name, str) else None
+        if handler is None:
+            raise ValueError(f"Unknown module {name!r}; expected one of {', '.join(sorted(self.handlers))}")
+        args = request.get("args") or {}
+        if not isinstance(args, dict):
+            raise ValueError("Module arguments must be a JSON object")
+        reserved = RESERVED_ARGS.intersection(args)
+        if reserved:
+            raise ValueError(f"Arguments {', '.join(sorted(reserved))} are set by the daemon")
+        kwargs: Dict[str, object] = {"structured": self.structured, "deadline": self.deadline, **args}
+        return handler(pool=self.pool, limiter=self.limiter, **kwargs)
+
+
+def serve(
+    socket_path: str,
+    handlers: Mapping[str, Callable[..., object]],
+    pool: BrowserPool,
+    *,
+    limiter: Optional[AdaptiveLimiter] = None,
+    structured: bool = False,
+    deadline: Optional[float] = None,
+) -> int:
+    """Warm ``pool`` and answer module requests until interrupted, then close it.
+
+    Requests share ``limiter``, which defaults to one capped at the pool size
+    so the adaptive limit, not the pool, governs how many run at once.
+    ``structured`` and ``deadline`` are defaults a request's own arguments
+    may override.
+    """
+    if limiter is None:
+        limiter = AdaptiveLimiter(initial_limit=min(2, pool.size), max_limit=pool.size)
+    _remove_stale_socket(socket_path)
+    with pool:
+        pool.warm()
+        # Bind under a restrictive umask so the socket is never reachable by
+        # other users, not even between bind and chmod.
+        previous_umask = os.umask(0o177)
+        try:
+            server = _DaemonServer(socket_path, handlers, pool, limiter, structured, deadline)
+        finally:
+            os.umask(previous_umask)
+        os.chmod(socket_path, 0o600)
+        in_main_thread = threading.current_thread() is threading.main_thread()
+        if in_main_thread:
+            previous = signal.signal(signal.SIGTERM, _raise_system_exit)
+        LOGGER.info("BizAutoGen daemon listening on %s", socket_path)
+        try:
+            server.serve_forever()
+        except (KeyboardInterrupt, SystemExit):
+            LOGGER.info("Shutting down BizAutoGen daemon")
+        finally:
+            if in_main_thread:
+                signal.signal(signal.SIGTERM, previous)
+            server.server_close()
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+    return 0
+
+
+def _raise_system_exit(signum, frame) -> None:
+    raise SystemExit(0)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.unlink(socket_path)
+    else:
+        raise RuntimeError(f"A daemon is already listening on {socket_path}")
+    finally:
+        probe.close()
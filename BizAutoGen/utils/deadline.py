@@ -0,0 +1,78 @@
+"""End-to-end request deadlines shared by every browser phase."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request's time budget runs out, naming the phase it ran out in."""
+
+    def __init__(self, phase: str, deadline: "Deadline") -> None:
+        self.phase = phase
+        self.spent = dict(deadline.spent)
+        breakdown = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in self.spent.items())
+        message = f"Request deadline of {deadline.budget:.1f}s exhausted during {phase}"
+        super().__init__(f"{message} ({breakdown})" if breakdown else message)
+
+
+class Deadline:
+    """A fixed time budget that every wait in a request draws down."""
+
+    def __init__(self, budget: float) -> None:
+        if budget <= 0:
+            raise ValueError("Deadline budget must be positive")
+        self.budget = budget
+        self.spent: Dict[str, float] = {}
+        self._expires = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, never negative."""
+        return max(0.0, self._expires - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def seconds(self, phase: str, cap: Optional[float] = None) -> float:
+        """Return how long ``phase`` may wait, capped at ``cap`` when given.
+
+        Raises :class:`DeadlineExceeded` straight away when nothing is left.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(phase, self)
+        return remaining if cap is None else min(remaining, cap)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Account time to ``name`` and blame it for any failure after expiry."""
+        started = time.monotonic()
+        recorded = False
+        try:
+            yield
+        except DeadlineExceeded:
+            raise
+        except Exception as exc:
+            if not self.expired():
+                raise
+            self._record(name, started)
+            recorded = True
+            raise DeadlineExceeded(name, self) from exc
+        finally:
+            if not recorded:
+                self._record(name, started)
+
+    def _record(self, name: str, started: float) -> None:
+        self.spent[name] = self.spent.get(name, 0.0) + time.monotonic() - started
+
+
+def phase(deadline: Optional[Deadline], name: str) -> ContextManager[None]:
+    """Return ``deadline.phase(name)``, or a no-op when there is no deadline."""
+    return deadline.phase(name) if deadline is not None else nullcontext()
+
+
+def seconds(deadline: Optional[Deadline], phase_name: str, default: Optional[float]) -> Optional[float]:
+    """Return the wait allowed for ``phase_name``; ``default`` without a deadline."""
+    return deadline.seconds(phase_name, default) if deadline is not None else default
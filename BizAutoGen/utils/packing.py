@@ -0,0 +1,147 @@
+"""Pack several inputs for one module into a single cto.new prompt."""
+
+from __future__ import annotations
+
+import logging
+import re
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar, Union
+
+from .concurrency import AdaptiveLimiter, run_concurrently
+from .deadline import Deadline
+from .parser import JSON_ONLY_INSTRUCTION, clean_output, missing_sections
+from .session import run_prompt
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Replaces each request's "JSON and nothing else" instruction, which would
+# otherwise forbid the RESULT marker lines.
+_PACKED_JSON_INSTRUCTION = "After this request's RESULT line, answer with a single JSON object (no prose, no markdown)"
+
+_RESULT_MARKER = re.compile(r"^[ \t=#*]*RESULT[ \t]+(\d+)[ \t=#*]*$", re.IGNORECASE | re.MULTILINE)
+
+
+def pack_prompts(prompts: Sequence[str]) -> str:
+    """Combine per-input prompts into one prompt with numbered, delimited sections.
+
+    Structured prompts have their JSON-only output instruction rewritten so
+    that it no longer contradicts the RESULT markers.
+    """
+    structured = any(JSON_ONLY_INSTRUCTION in prompt for prompt in prompts)
+    requests = "\n\n".join(
+        f"=== REQUEST {number} ===\n{prompt.strip().replace(JSON_ONLY_INSTRUCTION, _PACKED_JSON_INSTRUCTION)}"
+        for number, prompt in enumerate(prompts, start=1)
+    )
+    json_note = (
+        " Each answer is a single JSON object without code fences; the RESULT lines are the only other text allowed."
+        if structured
+        else ""
+    )
+    return (
+        f"You will complete {len(prompts)} independent requests in a single reply.\n"
+        "Answer every request in order. Begin each answer with a line containing only"
+        " \"=== RESULT <n> ===\", where <n> is the request number, then answer exactly as that request asks."
+        f" Do not add any other text between answers.{json_note}\n\n"
+        f"{requests}\n"
+    )
+
+
+def split_packed(raw_text: str, count: int) -> Dict[int, str]:
+    """Split a packed response into answers keyed by zero-based request index.
+
+    Answers whose marker is missing, duplicated, out of range, or empty are
+    left out so the caller can retry those inputs on their own.
+    """
+    text = clean_output(raw_text)
+    markers = list(_RESULT_MARKER.finditer(text))
+    answers: Dict[int, str] = {}
+    duplicates = set()
+    for position, match in enumerate(markers):
+        index = int(match.group(1)) - 1
+        end = markers[position + 1].start() if position + 1 < len(markers) else len(text)
+        answer = text[match.end() : end].strip()
+        if not 0 <= index < count or not answer:
+            continue
+        if index in answers:
+            duplicates.add(index)
+        answers[index] = answer
+    for index in duplicates:
+        del answers[index]
+    return answers
+
+
+def run_packed(
+    prompts: Sequence[str],
+    parse: Callable[[str], T],
+    single: Callable[[int, Optional[float]], T],
+    *,
+    kind: str,
+    label: str,
+    error_message: str,
+    structured: bool = False,
+    pack_size: int = 5,
+    limiter: Optional[AdaptiveLimiter] = None,
+    deadline: Optional[float] = None,
+    **session,
+) -> List[Union[T, Exception]]:
+    """Run ``prompts`` in packs of ``pack_size`` and return one result per prompt.
+
+    Each answer split out of a packed response is checked with
+    :func:`missing_sections` for ``kind`` and parsed with ``parse``. Inputs
+    whose answer is missing or incomplete, or whose pack failed outright,
+    are retried individually through ``single(index, deadline)``. Packs and
+    retries run concurrently under ``limiter``; as with
+    :func:`run_concurrently`, a failed input yields its exception in place of
+    a result. ``deadline`` is one budget in seconds for the whole batch:
+    packs and retries are each given what is left of it when they start.
+    Remaining keyword arguments go to :func:`run_prompt`.
+    """
+    if pack_size < 1:
+        raise ValueError("Pack size must be at least 1")
+    budget = Deadline(deadline) if deadline is not None else None
+
+    def _remaining(phase: str) -> Optional[float]:
+        return budget.seconds(phase) if budget is not None else None
+
+    groups = [list(range(start, min(start + pack_size, len(prompts)))) for start in range(0, len(prompts), pack_size)]
+
+    def _run_group(indices: List[int]) -> Dict[int, str]:
+        if len(indices) == 1:
+            return {}
+        answers = run_prompt(
+            pack_prompts([prompts[index] for index in indices]),
+            lambda response: split_packed(response, len(indices)),
+            label=f"{label} (packed)",
+            error_message=error_message,
+            limiter=limiter,
+            deadline=_remaining("pack"),
+            settle=True,
+            **session,
+        )
+        return {indices[position]: answer for position, answer in answers.items()}
+
+    def _retry(index: int) -> T:
+        return single(index, _remaining("retry"))
+
+    results: List[Union[T, Exception, None]] = [None] * len(prompts)
+    retry: List[int] = []
+    outcomes = run_concurrently([partial(_run_group, group) for group in groups], limiter)
+    for group, outcome in zip(groups, outcomes):
+        if isinstance(outcome, Exception):
+            LOGGER.warning("%s pack of %s failed: %s", label, len(group), outcome)
+            outcome = {}
+        for index in group:
+            answer = outcome.get(index)
+            if answer is not None and not missing_sections(kind, answer, structured):
+                results[index] = parse(answer)
+            else:
+                retry.append(index)
+
+    if retry:
+        LOGGER.info("%s: retrying %s of %s input(s) individually", label, len(retry), len(prompts))
+        calls = [partial(_retry, index) for index in retry]
+        for index, outcome in zip(retry, run_concurrently(calls, limiter)):
+            results[index] = outcome
+    return results
@@ -2,8 +2,80 @@
 
 from __future__ import annotations
 
+import json
 import re
-from typing import Dict, List, Optional
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# Tally of which decoding path each parser took, keyed as "<kind>.<path>".
+# ``json`` means the structured payload decoded cleanly with every field,
+# ``json_partial`` that it decoded but some fields were missing or empty,
+# ``json_invalid`` that structured mode was requested but the regex path had
+# to take over, and ``regex`` counts every response that went through the
+# heading scraper.
+PARSE_STATS: Counter = Counter()
+
+# Output instruction that closes every structured prompt. Packed prompts swap
+# it for one that leaves room for the RESULT markers between answers.
+JSON_ONLY_INSTRUCTION = "Respond with a single JSON object and nothing else (no prose, no markdown)"
+
+# Heading aliases for every section a module asks for, keyed by parser kind and
+# result field. The first alias is the heading used when asking for a section.
+SECTION_HEADINGS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "swot": {
+        "strengths": ("Strengths",),
+        "weaknesses": ("Weaknesses", "Limitations"),
+        "opportunities": ("Opportunities",),
+        "threats": ("Threats", "Risks"),
+        "market_potential": ("Market Potential", "Market Outlook"),
+        "recommendations": ("Recommendations", "Next Steps", "Action Items"),
+    },
+    "marketing": {
+        "ad_copy": ("Ad Copy", "Advertisement", "Promo"),
+        "social_caption": ("Social Caption", "Social Media Caption", "Caption"),
+        "blog_intro": ("Blog Intro", "Blog Introduction", "Article Intro"),
+    },
+    "pricing": {
+        "recommended_price": ("Recommended Price", "Target Price", "Price Point"),
+        "strategy": ("Pricing Strategy", "Strategy", "Approach"),
+        "rationale": ("Rationale", "Justification", "Why"),
+    },
+    "plan": {
+        "executive_summary": ("Executive Summary",),
+        "market_analysis": ("Market Analysis",),
+        "offering": ("Product/Service Offering", "Product Offering", "Service Offering"),
+        "marketing_strategy": ("Marketing Strategy",),
+        "operations_plan": ("Operations Plan", "Operations"),
+        "financial_projections": ("Financial Projections", "Financials"),
+        "key_milestones": ("Key Milestones", "Milestones"),
+    },
+    "automation": {
+        "automation_plan": ("Automation Plan",),
+        "execution_steps": ("Step-by-Step Execution",),
+    },
+}
+
+# Headings may be numbered ("1. Executive Summary"), markdown headers or bold.
+_HEADING_PREFIX = r"[ \t]*(?:#{1,6}[ \t]*)?(?:\d+[.)][ \t]*)?[*_]{0,2}"
+_KNOWN_HEADINGS = "|".join(
+    sorted(
+        {re.escape(alias) for aliases in SECTION_HEADINGS.values() for names in aliases.values() for alias in names},
+        key=len,
+        reverse=True,
+    )
+)
+# A section ends at any "Label:" line, a markdown header, a line that is all
+# bold, or a known heading in any of the forms above. Other numbered lines are
+# list items and stay inside the section.
+_NEXT_HEADING = (
+    r"\n[A-Z][^\n]*:"
+    r"|\n#{1,6}[ \t]"
+    r"|\n[ \t]*[*_]{2}[^\n*_]+[*_]{2}:?[ \t]*(?=\n|\Z)"
+    rf"|\n{_HEADING_PREFIX}(?:{_KNOWN_HEADINGS})[*_]{{0,2}}[ \t]*(?::|[*_]{{0,2}}[ \t]*(?=\n|\Z))"
+)
+
+_SWOT_KEYS = ("strengths", "weaknesses", "opportunities", "threats")
+_LIST_FIELDS = frozenset(_SWOT_KEYS + ("recommendations", "execution_steps"))
 
 
 def clean_output(text: str) -> str:
@@ -16,17 +88,28 @@ def clean_output(text: str) -> str:
     return normalised.strip()
 
 
-def parse_swot(raw_text: str) -> Dict[str, object]:
+def parse_stats() -> Dict[str, int]:
+    """Return a snapshot of the parse path counters."""
+    return dict(PARSE_STATS)
+
+
+def reset_parse_stats() -> None:
+    """Clear the parse path counters."""
+    PARSE_STATS.clear()
+
+
+def parse_swot(raw_text: str, structured: bool = False) -> Dict[str, object]:
     """Parse SWOT analysis, market potential, and recommendations."""
+    if structured:
+        result = _structured_result("swot", raw_text, _swot_from_json)
+        if result is not None:
+            return result
+    PARSE_STATS["swot.regex"] += 1
     text = clean_output(raw_text)
-    swot = {
-        "strengths": _extract_list_section(text, ("Strengths",)),
-        "weaknesses": _extract_list_section(text, ("Weaknesses", "Limitations")),
-        "opportunities": _extract_list_section(text, ("Opportunities",)),
-        "threats": _extract_list_section(text, ("Threats", "Risks")),
-    }
-    market_potential = _extract_paragraph_section(text, ("Market Potential", "Market Outlook"))
-    recommendations = _extract_list_section(text, ("Recommendations", "Next Steps", "Action Items"))
+    headings = SECTION_HEADINGS["swot"]
+    swot = {key: _extract_list_section(text, headings[key]) for key in _SWOT_KEYS}
+    market_potential = _extract_paragraph_section(text, headings["market_potential"])
+    recommendations = _extract_list_section(text, headings["recommendations"])
 
     # Ensure defaults when sections are missing.
     for key, default in swot.items():
@@ -40,22 +123,32 @@ def parse_swot(raw_text: str) -> Dict[str, object]:
     }
 
 
-def parse_marketing(raw_text: str) -> Dict[str, str]:
+def parse_marketing(raw_text: str, structured: bool = False) -> Dict[str, str]:
     """Parse marketing content into ad copy, social caption, and blog intro."""
+    if structured:
+        result = _structured_result("marketing", raw_text, _marketing_from_json)
+        if result is not None:
+            return result
+    PARSE_STATS["marketing.regex"] += 1
     text = clean_output(raw_text)
     return {
-        "ad_copy": _extract_paragraph_section(text, ("Ad Copy", "Advertisement", "Promo")) or text,
-        "social_caption": _extract_paragraph_section(text, ("Social Caption", "Social Media Caption", "Caption")) or text,
-        "blog_intro": _extract_paragraph_section(text, ("Blog Intro", "Blog Introduction", "Article Intro")) or text,
+        key: _extract_paragraph_section(text, headings) or text
+        for key, headings in SECTION_HEADINGS["marketing"].items()
     }
 
 
-def parse_pricing(raw_text: str) -> Dict[str, str]:
+def parse_pricing(raw_text: str, structured: bool = False) -> Dict[str, str]:
     """Parse pricing recommendation details."""
+    if structured:
+        result = _structured_result("pricing", raw_text, _pricing_from_json)
+        if result is not None:
+            return result
+    PARSE_STATS["pricing.regex"] += 1
     text = clean_output(raw_text)
-    recommended_price = _extract_value(text, ("Recommended Price", "Target Price", "Price Point"))
-    strategy = _extract_paragraph_section(text, ("Strategy", "Pricing Strategy", "Approach"))
-    rationale = _extract_paragraph_section(text, ("Rationale", "Justification", "Why"))
+    headings = SECTION_HEADINGS["pricing"]
+    recommended_price = _extract_value(text, headings["recommended_price"])
+    strategy = _extract_paragraph_section(text, headings["strategy"])
+    rationale = _extract_paragraph_section(text, headings["rationale"])
 
     return {
         "recommended_price": recommended_price or "Pending further analysis",
@@ -64,19 +157,91 @@ def parse_pricing(raw_text: str) -> Dict[str, str]:
     }
 
 
-def parse_plan(raw_text: str) -> str:
+def parse_plan(raw_text: str, structured: bool = False) -> str:
     """Return a cleaned business plan document."""
+    if structured:
+        result = _structured_result("plan", raw_text, _plan_from_json)
+        if result is not None:
+            return result
+    PARSE_STATS["plan.regex"] += 1
     return clean_output(raw_text)
 
 
+def parse_automation(raw_text: str, structured: bool = False) -> Dict[str, object]:
+    """Parse an automation plan overview and its numbered execution steps."""
+    if structured:
+        result = _structured_result("automation", raw_text, _automation_from_json)
+        if result is not None:
+            return result
+    PARSE_STATS["automation.regex"] += 1
+    text = clean_output(raw_text)
+    headings = SECTION_HEADINGS["automation"]
+    plan = _extract_paragraph_section(text, headings["automation_plan"]) or text
+    steps = _extract_numbered_section(text, headings["execution_steps"]) or _fallback_list(text, limit=5)
+    return {
+        "automation_plan": plan,
+        "execution_steps": steps,
+    }
+
+
+# Parser for each kind in ``SECTION_HEADINGS``; all accept ``structured``.
+PARSERS = {
+    "swot": parse_swot,
+    "marketing": parse_marketing,
+    "pricing": parse_pricing,
+    "plan": parse_plan,
+    "automation": parse_automation,
+}
+
+
+def missing_sections(kind: str, raw_text: str, structured: bool = False) -> List[str]:
+    """Return the fields of ``kind`` that ``raw_text`` does not actually contain.
+
+    An empty list means every required section is present, so the parser will
+    not have to fall back to sentence scraping or the raw text. In structured
+    mode the entries are JSON key paths such as ``swot.threats``.
+    """
+    if structured:
+        return _missing_json_fields(kind, _decode_json(raw_text))
+    return _missing_text_sections(kind, clean_output(raw_text))
+
+
+def merge_continuation(raw_text: str, continuation: str, structured: bool = False) -> str:
+    """Combine a partial response with the reply to a continuation prompt."""
+    if structured:
+        extra = _decode_json(continuation)
+        if extra is not None:
+            return json.dumps(_merge_payloads(_decode_json(raw_text) or {}, extra))
+    return f"{clean_output(raw_text)}\n\n{clean_output(continuation)}"
+
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
 
+def _missing_text_sections(kind: str, text: str) -> List[str]:
+    missing: List[str] = []
+    for key, headings in SECTION_HEADINGS[kind].items():
+        if key == "recommended_price":
+            found = _extract_value(text, headings)
+        elif key == "execution_steps":
+            found = _extract_numbered_section(text, headings)
+        elif key in _LIST_FIELDS:
+            found = _extract_list_section(text, headings)
+        else:
+            found = _extract_paragraph_section(text, headings)
+        if not found:
+            missing.append(key)
+    return missing
+
+
 def _extract_section(text: str, headings: tuple[str, ...]) -> Optional[str]:
     pattern = r"|".join(re.escape(heading) for heading in headings)
-    regex = re.compile(rf"(?:^|\n)(?:{pattern})\s*:?(.*?)(?=\n[A-Z][^\n]*:|\Z)", re.IGNORECASE | re.DOTALL)
+    regex = re.compile(
+        rf"(?:^|\n){_HEADING_PREFIX}(?:{pattern})[*_]{{0,2}}[ \t]*:?[*_]{{0,2}}(.*?)(?={_NEXT_HEADING}|\Z)",
+        re.IGNORECASE | re.DOTALL,
+    )
     match = regex.search(text)
     if not match:
         return None
@@ -98,6 +263,22 @@ def _extract_list_section(text: str, headings: tuple[str, ...]) -> List[str]:
     return items
 
 
+def _extract_numbered_section(text: str, headings: tuple[str, ...]) -> List[str]:
+    section = _extract_section(text, headings)
+    if not section:
+        return []
+    steps: List[str] = []
+    for line in section.splitlines():
+        cleaned = line.strip()
+        if not cleaned:
+            continue
+        cleaned = re.sub(r"^[\d]+[.)]\s*", "", cleaned)
+        cleaned = re.sub(r"^[\-*•]\s*", "", cleaned)
+        if cleaned:
+            steps.append(cleaned)
+    return steps
+
+
 def _extract_paragraph_section(text: str, headings: tuple[str, ...]) -> Optional[str]:
     section = _extract_section(text, headings)
     if not section:
@@ -106,14 +287,147 @@ def _extract_paragraph_section(text: str, headings: tuple[str, ...]) -> Optional
 
 
 def _extract_value(text: str, headings: tuple[str, ...]) -> Optional[str]:
-    regex = re.compile(rf"(?:^|\n)({'|'.join(re.escape(h) for h in headings)})\s*:?\s*(.+)", re.IGNORECASE)
+    pattern = "|".join(re.escape(heading) for heading in headings)
+    regex = re.compile(
+        rf"(?:^|\n){_HEADING_PREFIX}(?:{pattern})[*_]{{0,2}}\s*:?[*_]{{0,2}}\s*(.+)",
+        re.IGNORECASE,
+    )
     match = regex.search(text)
     if match:
-        return match.group(2).strip()
+        return match.group(1).strip()
     return None
 
 
-def _fallback_list(text: str) -> List[str]:
+def _fallback_list(text: str, limit: int = 3) -> List[str]:
     """Provide a fallback list by taking the first few sentences."""
     sentences = re.split(r"(?<=[.!?])\s+", text)
-    return [sentence.strip() for sentence in sentences if sentence.strip()][:3]
+    return [sentence.strip() for sentence in sentences if sentence.strip()][:limit]
+
+
+# ---------------------------------------------------------------------------
+# Structured (JSON) responses
+# ---------------------------------------------------------------------------
+
+
+def _structured_result(kind: str, raw_text: str, builder):
+    """Decode a JSON response with ``builder`` and record which path was taken.
+
+    A payload that decodes but lacks some fields keeps the fields it has and
+    is counted as ``json_partial``; only undecodable JSON returns ``None``.
+    """
+    payload = _decode_json(raw_text)
+    result = builder(payload) if payload is not None else None
+    if result is None:
+        PARSE_STATS[f"{kind}.json_invalid"] += 1
+        return None
+    PARSE_STATS[f"{kind}.json_partial" if _missing_json_fields(kind, payload) else f"{kind}.json"] += 1
+    return result
+
+
+def _missing_json_fields(kind: str, payload: Optional[Dict[str, object]]) -> List[str]:
+    if kind == "plan":
+        rendered = _plan_from_json(payload) if payload is not None else None
+        return ["sections"] if rendered is None else _missing_text_sections(kind, rendered)
+    return [
+        f"swot.{key}" if kind == "swot" and key in _SWOT_KEYS else key
+        for key in SECTION_HEADINGS[kind]
+        if payload is None or _json_field(kind, payload, key) is None
+    ]
+
+
+def _decode_json(raw_text: str) -> Optional[Dict[str, object]]:
+    """Decode the JSON object in a response, tolerating code fences and chatter."""
+    text = (raw_text or "").strip()
+    if not text:
+        return None
+    fenced = re.search(r"```(?:json)?\s*(.*?)```", text, re.DOTALL)
+    if fenced:
+        text = fenced.group(1).strip()
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    try:
+        payload = json.loads(text[start : end + 1])
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _json_field(kind: str, payload: Dict[str, object], key: str):
+    container = payload.get("swot") if kind == "swot" and key in _SWOT_KEYS else payload
+    value = container.get(key) if isinstance(container, dict) else None
+    return _json_list(value) if key in _LIST_FIELDS else _json_text(value)
+
+
+def _merge_payloads(base: Dict[str, object], extra: Dict[str, object]) -> Dict[str, object]:
+    merged = dict(base)
+    for key, value in extra.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_payloads(merged[key], value)
+        elif isinstance(value, list) and key == "sections" and isinstance(merged.get(key), list):
+            merged[key] = merged[key] + value
+        elif value:
+            merged[key] = value
+    return merged
+
+
+def _json_text(value: object) -> Optional[str]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    if not isinstance(value, str) or not value.strip():
+        return None
+    return clean_output(value)
+
+
+def _json_list(value: object) -> Optional[List[str]]:
+    if not isinstance(value, list):
+        return None
+    items = [_json_text(item) for item in value]
+    items = [item for item in items if item]
+    return items or None
+
+
+# Builders keep every field the payload has and fill the rest with empty
+# defaults; the JSON text itself is never worth scraping for headings.
+
+
+def _swot_from_json(payload: Dict[str, object]) -> Dict[str, object]:
+    market_potential = _json_field("swot", payload, "market_potential")
+    recommendations = _json_field("swot", payload, "recommendations")
+    return {
+        "swot": {key: _json_field("swot", payload, key) or [] for key in _SWOT_KEYS},
+        "market_potential": market_potential or "",
+        "recommendations": (recommendations or [])[:3],
+    }
+
+
+def _marketing_from_json(payload: Dict[str, object]) -> Dict[str, str]:
+    return {key: _json_field("marketing", payload, key) or "" for key in SECTION_HEADINGS["marketing"]}
+
+
+def _pricing_from_json(payload: Dict[str, object]) -> Dict[str, str]:
+    result = {key: _json_field("pricing", payload, key) or "" for key in SECTION_HEADINGS["pricing"]}
+    result["recommended_price"] = result["recommended_price"] or "Pending further analysis"
+    return result
+
+
+def _plan_from_json(payload: Dict[str, object]) -> Optional[str]:
+    sections = payload.get("sections")
+    if not isinstance(sections, list):
+        return None
+    blocks: List[str] = []
+    for section in sections:
+        if not isinstance(section, dict):
+            continue
+        heading = _json_text(section.get("heading"))
+        content = _json_text(section.get("content"))
+        if heading is not None and content is not None:
+            blocks.append(f"{heading}:\n{content}")
+    return "\n\n".join(blocks) or None
+
+
+def _automation_from_json(payload: Dict[str, object]) -> Dict[str, object]:
+    return {
+        "automation_plan": _json_field("automation", payload, "automation_plan") or "",
+        "execution_steps": _json_field("automation", payload, "execution_steps") or [],
+    }
@@ -0,0 +1,172 @@
+"""Pool of warm Selenium sessions shared across requests."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from .browser import SeleniumBrowser
+from .profiles import ProfileLease, ProfilePool
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """Keep up to ``size`` browsers alive and lend them out one request at a time.
+
+    A browser that raises while lent out is closed instead of being returned,
+    so a wedged session never serves a second request. With ``profiles`` each
+    browser keeps one persistent profile locked for as long as it lives.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        headless: bool = True,
+        browser: str = "chrome",
+        timeout: int = 60,
+        profiles: Optional[ProfilePool] = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        if profiles is not None and profiles.size < size:
+            raise ValueError("Profile pool must hold at least one profile per pooled browser")
+        self.size = size
+        self.headless = headless
+        self.browser_name = browser
+        self.timeout = timeout
+        self.profiles = profiles
+        self._leases: Dict[int, ProfileLease] = {}
+        self._idle: List[SeleniumBrowser] = []
+        self._created = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def warm(self) -> None:
+        """Launch browsers until the pool is full."""
+        launched: List[SeleniumBrowser] = []
+        while True:
+            with self._condition:
+                if self._closed or self._created >= self.size:
+                    break
+                self._created += 1
+            try:
+                launched.append(self._launch())
+            except Exception:
+                with self._condition:
+                    self._created -= 1
+                raise
+        with self._condition:
+            self._idle.extend(launched)
+            self._condition.notify_all()
+        LOGGER.info("Browser pool warmed with %s session(s)", self._created)
+
+    @contextmanager
+    def browser(self, timeout: Optional[float] = None) -> Iterator[SeleniumBrowser]:
+        """Borrow a browser for the duration of one request.
+
+        Raises ``TimeoutError`` if none is free within ``timeout`` seconds.
+        """
+        instance = self._acquire(timeout)
+        try:
+            yield instance
+        except TimeoutError:
+            # A caller's deadline ran out; the next request navigates afresh,
+            # so the session is still good.
+            self._release(instance)
+            raise
+        except BaseException:
+            self._discard(instance)
+            raise
+        else:
+            self._release(instance)
+
+    def close(self) -> None:
+        """Close every idle browser and refuse further requests."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._condition.notify_all()
+        for instance in idle:
+            self._close(instance)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _new_browser(self, user_data_dir: Optional[str]) -> SeleniumBrowser:
+        """Create one browser; subclasses override this to change the transport."""
+        return SeleniumBrowser(
+            headless=self.headless,
+            browser=self.browser_name,
+            timeout=self.timeout,
+            user_data_dir=user_data_dir,
+        )
+
+    def _launch(self) -> SeleniumBrowser:
+        if self.profiles is None:
+            return self._new_browser(None)
+        lease = self.profiles.acquire()
+        try:
+            instance = self._new_browser(lease.path)
+        except BaseException:
+            lease.release()
+            raise
+        self._leases[id(instance)] = lease
+        return instance
+
+    def _close(self, instance: SeleniumBrowser) -> None:
+        instance.close()
+        lease = self._leases.pop(id(instance), None)
+        if lease is not None:
+            lease.release()
+
+    def _acquire(self, timeout: Optional[float]) -> SeleniumBrowser:
+        expires = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                remaining = None if expires is None else expires - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("Timed out waiting for a pooled browser")
+                self._condition.wait(remaining)
+        try:
+            return self._launch()
+        except BaseException:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, instance: SeleniumBrowser) -> None:
+        with self._condition:
+            if not self._closed:
+                self._idle.append(instance)
+                self._condition.notify()
+                return
+            self._created -= 1
+        self._close(instance)
+
+    def _discard(self, instance: SeleniumBrowser) -> None:
+        LOGGER.debug("Discarding browser session after a failed request")
+        self._close(instance)
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
@@ -0,0 +1,190 @@
+"""Pool of persistent browser profiles (``--user-data-dir``) for warm caches."""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+try:  # POSIX
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+LOGGER = logging.getLogger(__name__)
+
+# Files Chrome/Edge leave in a user-data-dir to claim it; a crash leaves them behind.
+_BROWSER_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+
+
+def default_profile_root() -> str:
+    """Return the per-user directory that holds the pooled profiles."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "bizautogen", "profiles")
+
+
+class ProfileLease:
+    """A profile directory held exclusively until :meth:`release` is called."""
+
+    def __init__(self, pool: "ProfilePool", path: str, lock_fd: int) -> None:
+        self.path = path
+        self._pool = pool
+        self._lock_fd: Optional[int] = lock_fd
+
+    def release(self) -> None:
+        if self._lock_fd is None:
+            return
+        _unlock(self._lock_fd)
+        self._lock_fd = None
+        self._pool._notify()
+
+
+class ProfilePool:
+    """Hand out ``size`` persistent profiles, never the same one to two drivers.
+
+    Each profile is a directory ``profile-<n>`` under ``root`` guarded by an
+    OS file lock on ``profile-<n>.lock``. The lock is held for the lifetime
+    of the lease and dropped by the kernel when its process dies, so a crash
+    never leaves a profile claimed.
+    """
+
+    def __init__(self, root: Optional[str] = None, size: int = 4, poll_interval: float = 0.5) -> None:
+        if size < 1:
+            raise ValueError("Profile pool size must be at least 1")
+        self.root = root or default_profile_root()
+        self.size = size
+        self.poll_interval = poll_interval
+        self._condition = threading.Condition()
+        os.makedirs(self.root, exist_ok=True)
+
+    def acquire(self, timeout: Optional[float] = None) -> ProfileLease:
+        """Lock a free profile, waiting up to ``timeout`` seconds for one.
+
+        Raises ``TimeoutError`` when every profile stays busy.
+        """
+        expires = None if timeout is None else time.monotonic() + timeout
+        while True:
+            lease = self._try_acquire()
+            if lease is not None:
+                return lease
+            remaining = None if expires is None else expires - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError("Timed out waiting for a free browser profile")
+            with self._condition:
+                self._condition.wait(self.poll_interval if remaining is None else min(self.poll_interval, remaining))
+
+    @contextmanager
+    def profile(self, timeout: Optional[float] = None) -> Iterator[str]:
+        """Hold a profile for the duration of the block and yield its path."""
+        lease = self.acquire(timeout)
+        try:
+            yield lease.path
+        finally:
+            lease.release()
+
+    def clean_stale_locks(self) -> List[str]:
+        """Remove browser lock files left in idle profiles and return those profile paths."""
+        freed: List[str] = []
+        for index in range(self.size):
+            path, lock_path = self._paths(index)
+            fd = _lock(lock_path)
+            if fd is None:
+                continue
+            try:
+                if _remove_browser_locks(path):
+                    freed.append(path)
+                    LOGGER.info("Cleared stale browser locks in %s", path)
+            finally:
+                _unlock(fd)
+        return freed
+
+    def reset(self) -> List[str]:
+        """Delete every profile that is not in use and return the ones skipped as busy."""
+        busy: List[str] = []
+        for index in range(self.size):
+            path, lock_path = self._paths(index)
+            # Hold the lock while deleting so no other process can start a
+            # browser on a half-removed profile.
+            fd = _lock(lock_path)
+            if fd is None:
+                busy.append(path)
+                continue
+            try:
+                shutil.rmtree(path, ignore_errors=True)
+            finally:
+                _unlock(fd)
+        LOGGER.info("Reset browser profiles under %s (%s busy)", self.root, len(busy))
+        return busy
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _paths(self, index: int) -> tuple[str, str]:
+        path = os.path.join(self.root, f"profile-{index}")
+        return path, f"{path}.lock"
+
+    def _try_acquire(self) -> Optional[ProfileLease]:
+        for index in range(self.size):
+            path, lock_path = self._paths(index)
+            fd = _lock(lock_path)
+            if fd is None:
+                continue
+            os.makedirs(path, exist_ok=True)
+            # Nobody else holds the profile, so any browser lock files in it
+            # are leftovers from an unclean shutdown.
+            _remove_browser_locks(path)
+            LOGGER.debug("Acquired browser profile %s", path)
+            return ProfileLease(self, path, fd)
+        return None
+
+    def _notify(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
+
+
+def _lock(lock_path: str) -> Optional[int]:
+    """Take a non-blocking exclusive lock on ``lock_path``; ``None`` if it is held.
+
+    Lock files are never deleted: removing one while another process opens it
+    would let two owners lock different files under the same name.
+    """
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:  # pragma: no cover - Windows
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _unlock(fd: int) -> None:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+
+def _remove_browser_locks(path: str) -> bool:
+    removed = False
+    for name in _BROWSER_LOCK_FILES:
+        target = os.path.join(path, name)
+        if os.path.lexists(target):
+            try:
+                os.unlink(target)
+                removed = True
+            except OSError:  # pragma: no cover - best effort cleanup
+                LOGGER.debug("Could not remove %s", target)
+    return removed
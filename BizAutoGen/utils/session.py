@@ -0,0 +1,142 @@
+"""Shared request lifecycle for the BizAutoGen modules."""
+
+from __future__ import annotations
+
+import logging
+from contextlib import ExitStack
+from typing import Callable, List, Optional, TypeVar
+
+from selenium.common.exceptions import TimeoutException
+
+from .browser import SeleniumBrowser
+from .concurrency import AdaptiveLimiter, default_limiter
+from .deadline import Deadline, DeadlineExceeded, phase, seconds
+from .parser import SECTION_HEADINGS, merge_continuation, missing_sections
+from .pool import BrowserPool
+from .profiles import ProfilePool
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def run_prompt(
+    prompt: str,
+    parse: Callable[[str], T],
+    *,
+    label: str,
+    error_message: str,
+    headless: bool = True,
+    retries: int = 2,
+    limiter: Optional[AdaptiveLimiter] = None,
+    pool: Optional[BrowserPool] = None,
+    deadline: Optional[float] = None,
+    kind: Optional[str] = None,
+    structured: bool = False,
+    profiles: Optional[ProfilePool] = None,
+    settle: bool = False,
+) -> T:
+    """Send ``prompt`` to cto.new and return the parsed response.
+
+    Each attempt borrows a warm browser from ``pool`` when one is given (its
+    own ``headless`` setting then applies) and launches a fresh one otherwise,
+    on a persistent profile from ``profiles`` when given.
+    Attempts hold a slot on ``limiter`` (the shared default when omitted) and
+    report their response-start latency back to it. After ``retries`` failed
+    retries a ``RuntimeError`` carrying ``error_message`` is raised.
+
+    ``deadline`` is a budget in seconds for the whole call, retries included.
+    Every wait draws on what is left of it, and once it is spent
+    :class:`DeadlineExceeded` is raised straight away, naming the phase that
+    ran out of time.
+
+    When ``kind`` names a parser in ``SECTION_HEADINGS`` the response is
+    checked for every required section before parsing. Gaps are closed in the
+    same browser session, first by waiting for the text to settle and then by
+    asking once for just the missing sections; if a wait or the deadline runs
+    out meanwhile, the response read so far is parsed as is. ``settle``
+    always waits for the text to stop changing, for long responses that have
+    no section check.
+    """
+    limiter = limiter or default_limiter()
+    budget = Deadline(deadline) if deadline is not None else None
+    last_error: Exception | None = None
+    for attempt in range(1, retries + 2):
+        try:
+            with ExitStack() as stack:
+                with phase(budget, "queue"):
+                    slot = stack.enter_context(limiter.slot(timeout=seconds(budget, "queue", None)))
+                    if pool is not None:
+                        browser = stack.enter_context(pool.browser(timeout=seconds(budget, "queue", None)))
+                if pool is None:
+                    with phase(budget, "launch"):
+                        seconds(budget, "launch", None)
+                        profile_dir = None
+                        if profiles is not None:
+                            profile_dir = stack.enter_context(profiles.profile(timeout=seconds(budget, "launch", None)))
+                        browser = stack.enter_context(SeleniumBrowser(headless=headless, user_data_dir=profile_dir))
+                browser.open_cto_new(deadline=budget)
+                browser.send_prompt(prompt, deadline=budget)
+                slot.record(browser.timings.get("response_start"))
+                response = browser.extract_response(deadline=budget)
+                if settle:
+                    response = browser.wait_for_stable_response(deadline=budget)
+                if kind is not None:
+                    response = _complete_response(browser, response, kind, structured, budget, label)
+            return parse(response)
+        except DeadlineExceeded as exc:
+            LOGGER.error("%s attempt %s abandoned: %s", label, attempt, exc)
+            raise
+        except Exception as exc:  # pragma: no cover - relies on live interaction
+            last_error = exc
+            LOGGER.exception("%s attempt %s failed", label, attempt)
+    raise RuntimeError(error_message) from last_error
+
+
+def _complete_response(
+    browser: SeleniumBrowser,
+    response: str,
+    kind: str,
+    structured: bool,
+    budget: Optional[Deadline],
+    label: str,
+) -> str:
+    missing = missing_sections(kind, response, structured)
+    if not missing:
+        return response
+    LOGGER.info("%s response is missing %s; waiting for it to settle", label, ", ".join(missing))
+    try:
+        response = browser.wait_for_stable_response(deadline=budget)
+        missing = missing_sections(kind, response, structured)
+        if not missing:
+            return response
+        LOGGER.info("%s response still lacks %s; requesting a continuation", label, ", ".join(missing))
+        browser.send_prompt(_continuation_prompt(kind, missing, structured), deadline=budget)
+        continuation = browser.wait_for_stable_response(deadline=budget)
+    except (TimeoutException, TimeoutError) as exc:
+        # Includes DeadlineExceeded: what was already read still parses.
+        LOGGER.warning("%s response incomplete (%s); keeping the partial response", label, exc)
+        return response
+    return merge_continuation(response, continuation, structured)
+
+
+def _continuation_prompt(kind: str, missing: List[str], structured: bool) -> str:
+    if structured and kind == "plan":
+        wanted = [SECTION_HEADINGS[kind][key][0] for key in missing if key in SECTION_HEADINGS[kind]]
+        return (
+            "Your previous answer was incomplete. Reply with a single JSON object and nothing else,"
+            ' using the same schema as before but with a "sections" list covering only: '
+            f"{', '.join(wanted) or 'every section'}.\n"
+        )
+    if structured:
+        return (
+            "Your previous answer was incomplete. Reply with a single JSON object and nothing else,"
+            " using the same schema as before but containing only these keys: "
+            f"{', '.join(missing)}.\n"
+        )
+    headings = "\n".join(f"{SECTION_HEADINGS[kind][key][0]}:" for key in missing)
+    return (
+        "Your previous answer was incomplete. Continue with only the missing sections below,"
+        " using exactly these headings and the same format as before:\n"
+        f"{headings}\n"
+    )